@@ -0,0 +1,133 @@
+"""Sound effects loaded off the startup path.
+
+``load_sound`` returns a handle at once and queues the file for a
+background thread. Until the sound is ready, ``play`` is a silent no-op.
+Decoded PCM is cached under ``.cache/audio/``, keyed by the file's hash
+and the mixer format, so MP3s are decoded once rather than on every
+launch::
+
+    sound_eat = load_sound("eat_point.mp3")
+    sound_eat.play()   # silent if still loading or the file is missing
+"""
+import hashlib
+import os
+import queue
+import threading
+
+import pygame
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+CACHE_DIR = os.path.join(BASE_DIR, ".cache", "audio")
+
+
+class SoundHandle:
+    """Stands in for a ``pygame.mixer.Sound`` that may not be loaded yet"""
+
+    def __init__(self, path):
+        self.path = path
+        self.sound = None
+        self.volume = None
+        self.ready = threading.Event()  # set once loaded, or found missing
+
+    def play(self, *args, **kwargs):
+        if self.sound is not None:
+            return self.sound.play(*args, **kwargs)
+        return None
+
+    def set_volume(self, volume):
+        self.volume = volume
+        if self.sound is not None:
+            self.sound.set_volume(volume)
+
+    def _loaded(self, sound):
+        if self.volume is not None:
+            sound.set_volume(self.volume)
+        self.sound = sound
+        self.ready.set()
+
+
+def cache_path(path, cache_dir=CACHE_DIR):
+    """Where the decoded PCM of ``path`` goes for the current mixer format"""
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:16]
+    frequency, size, channels = pygame.mixer.get_init()
+    sample = f"{'s' if size < 0 else 'u'}{abs(size)}"
+    return os.path.join(cache_dir, f"{digest}-{frequency}hz-{sample}-{channels}ch.pcm")
+
+
+def decode(path, cache_dir=CACHE_DIR):
+    """A Sound for ``path``, from the PCM cache when possible"""
+    cached = cache_path(path, cache_dir)
+    try:
+        with open(cached, "rb") as f:
+            return pygame.mixer.Sound(buffer=f.read())
+    except OSError:
+        pass
+    sound = pygame.mixer.Sound(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(sound.get_raw())
+        os.replace(tmp, cached)
+    except OSError as e:
+        print("Audio cache Error:", e)
+    return sound
+
+
+# -------------------------------
+# Background loader
+# -------------------------------
+_handles = {}  # path -> SoundHandle, shared by every game in this process
+_jobs = queue.Queue()
+_loader = None
+_lock = threading.Lock()
+
+
+def _load_forever():
+    while True:
+        handle = _jobs.get()
+        try:
+            if os.path.exists(handle.path) and pygame.mixer.get_init():
+                handle._loaded(decode(handle.path))
+        except (pygame.error, OSError) as e:
+            print("Sound Error:", e)
+        finally:
+            handle.ready.set()
+
+
+def load_sound(name, assets_dir=ASSETS_DIR):
+    """Handle for a sound in the assets folder; loading happens in the background"""
+    global _loader
+    path = os.path.join(assets_dir, name)
+    with _lock:
+        handle = _handles.get(path)
+        if handle is not None:
+            return handle
+        handle = _handles[path] = SoundHandle(path)
+        if _loader is None:
+            _loader = threading.Thread(target=_load_forever, name="audio-load", daemon=True)
+            _loader.start()
+    _jobs.put(handle)
+    return handle
+
+
+_music_exists = {}
+
+def play_music(name, volume, assets_dir=ASSETS_DIR):
+    """Loop background music from the assets folder, if the file exists"""
+    path = os.path.join(assets_dir, name)
+    exists = _music_exists.get(path)
+    if exists is None:
+        exists = _music_exists[path] = os.path.exists(path)
+    if exists:
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(-1)
+
+
+def wait_all(timeout=None):
+    """Block until every queued sound has finished loading (for tools and tests)"""
+    for handle in list(_handles.values()):
+        handle.ready.wait(timeout)
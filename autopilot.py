@@ -0,0 +1,329 @@
+"""Autopilot for SnakeEngine: shortest safe path to the food, with a
+Hamiltonian cycle to fall back on.
+
+A path is searched once per food and then followed tick by tick. It only
+needs replanning when the food moves or the next cell is blocked, so most
+ticks cost a few comparisons. Before a path is taken, the search checks
+that the tail can still be reached once the food is eaten. When no food
+path is safe, the bot follows the board's Hamiltonian cycle (or any move
+that keeps the tail reachable) and only searches again every
+REPLAN_INTERVAL ticks. Once the body lies in cycle order the bot stays on
+the cycle for the rest of the game: that can never collide, and shortcuts
+toward the food within the empty stretch ahead keep it fast without any
+search::
+
+    pilot = Autopilot(engine)
+    engine.step(pilot.next_action())
+
+    python autopilot.py --games 200         # headless soak test of the engine
+"""
+import argparse
+import time
+from collections import deque
+from heapq import heappop, heappush
+
+from snake_engine import POINTS_PER_FOOD, SnakeEngine
+
+# Ticks to wait before searching again after no safe food path was found
+REPLAN_INTERVAL = 16
+
+
+def hamiltonian_cycle(cols, rows):
+    """Cells of a cycle visiting the whole board, or None if both sides are
+    odd (no cycle exists). Serpentine over columns 1.. and back up column 0;
+    odd-height boards use the same pattern transposed."""
+    if rows % 2 == 0:
+        cycle = []
+        for row in range(rows):
+            cols_in_row = range(1, cols) if row % 2 == 0 else range(cols - 1, 0, -1)
+            cycle.extend(row * cols + col for col in cols_in_row)
+        cycle.extend(row * cols for row in range(rows - 1, -1, -1))
+        return cycle
+    if cols % 2 == 0:
+        # In the transposed board cell (col, row) is numbered col * rows + row
+        return [(cell % rows) * cols + cell // rows for cell in hamiltonian_cycle(rows, cols)]
+    return None
+
+
+def adjacency(cols, rows):
+    """Neighbouring cells of every cell, as tuples"""
+    table = []
+    for cell in range(cols * rows):
+        row, col = divmod(cell, cols)
+        cells = []
+        if row > 0:
+            cells.append(cell - cols)
+        if col < cols - 1:
+            cells.append(cell + 1)
+        if row < rows - 1:
+            cells.append(cell + cols)
+        if col > 0:
+            cells.append(cell - 1)
+        table.append(tuple(cells))
+    return table
+
+
+class Autopilot:
+    """Chooses a direction for ``engine`` every tick. ``plans`` counts path
+    searches and ``fallbacks`` ticks spent without a safe food path."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        cols = engine.cols
+        self.adjacent = adjacency(cols, engine.rows)
+        # Cell offset -> direction index (UP, RIGHT, DOWN, LEFT)
+        self.direction_of = {-cols: 0, 1: 1, cols: 2, -1: 3}
+        cycle = hamiltonian_cycle(cols, engine.rows)
+        self.cycle_next = self.cycle_order = None
+        if cycle is not None:
+            self.cycle_next = [0] * len(cycle)
+            self.cycle_order = [0] * len(cycle)
+            for i, cell in enumerate(cycle):
+                self.cycle_next[cell] = cycle[(i + 1) % len(cycle)]
+                self.cycle_order[cell] = i
+        self.path = deque()  # cells still to visit, next one first
+        self.target = None  # the food self.path leads to
+        self.retry_at = 0  # engine tick of the next search while falling back
+        self.ordered = False  # body lies in cycle order: endgame on the cycle
+        self.stuck = 0  # fallback moves since the last food path
+        self.plans = 0
+        self.fallbacks = 0
+
+    def next_action(self):
+        engine = self.engine
+        body = engine.body
+        head, tail = body[0], body[-1]
+        is_free = engine.free_cells.is_free
+        path = self.path
+
+        if self.ordered:
+            return self._cycle_step()
+
+        # Keep following the planned path while it still leads to this food
+        if path and self.target == engine.food and path[0] in self.adjacent[head] \
+                and (is_free(path[0]) or path[0] == tail):
+            return self.direction_of[path.popleft() - head]
+
+        if engine.ticks >= self.retry_at:
+            path = self._plan()
+            if path:
+                self.path, self.target = path, engine.food
+                self.stuck = 0
+                return self.direction_of[path.popleft() - head]
+            self.retry_at = engine.ticks + REPLAN_INTERVAL
+        self.path.clear()
+        self.fallbacks += 1
+        return self._fallback()
+
+    # -------------------------------
+    # Search
+    # -------------------------------
+    def _search(self, start, goal, blocked):
+        """Shortest path from start to goal (start excluded) avoiding the
+        ``blocked`` cells, or None"""
+        adjacent = self.adjacent
+        parent = {start: None}
+        frontier = [start]
+        while frontier:
+            reached = []
+            for cell in frontier:
+                for nxt in adjacent[cell]:
+                    if nxt == goal:
+                        path = deque((nxt,))
+                        while cell != start:
+                            path.appendleft(cell)
+                            cell = parent[cell]
+                        return path
+                    if nxt not in parent and nxt not in blocked:
+                        parent[nxt] = cell
+                        reached.append(nxt)
+            frontier = reached
+        return None
+
+    def _reachable(self, start, goal, blocked):
+        """Is there any path from start to goal avoiding ``blocked``?
+        Greedy best-first toward the goal: it only has to find some path,
+        which in open space means visiting little more than that path."""
+        adjacent = self.adjacent
+        cols = self.engine.cols
+        goal_row, goal_col = divmod(goal, cols)
+        seen = {start}
+        heap = [(0, start)]
+        while heap:
+            cell = heappop(heap)[1]
+            for nxt in adjacent[cell]:
+                if nxt == goal:
+                    return True
+                if nxt not in seen and nxt not in blocked:
+                    seen.add(nxt)
+                    row, col = divmod(nxt, cols)
+                    heappush(heap, (abs(row - goal_row) + abs(col - goal_col), nxt))
+        return False
+
+    def _cycle_ordered(self, body):
+        """Does the body, read from tail to head, only move forward along the
+        cycle? Then every body cell lies behind the head within one lap, so
+        the head's cycle successor is free (or is the departing tail)."""
+        order = self.cycle_order
+        size = len(order)
+        tail = order[body[-1]]
+        last = -1
+        for cell in reversed(body):
+            ahead = (order[cell] - tail) % size
+            if ahead <= last:
+                return False
+            last = ahead
+        return True
+
+    def _cycle_step(self):
+        """Next cell along the cycle, or a shortcut that jumps ahead toward
+        the food without passing it or the tail. The body stays in cycle
+        order either way, so the move is always safe."""
+        engine = self.engine
+        body = engine.body
+        head = body[0]
+        order = self.cycle_order
+        size = len(order)
+        position = order[head]
+        tail_gap = (order[body[-1]] - position) % size or size
+        food_gap = (order[engine.food] - position) % size if engine.food is not None else 1
+        best, best_gap = self.cycle_next[head], 1
+        for cell in self.adjacent[head]:
+            gap = (order[cell] - position) % size
+            if best_gap < gap <= food_gap and gap < tail_gap:
+                best, best_gap = cell, gap
+        return self.direction_of[best - head]
+
+    def _room(self, body):
+        """Number of free cells the head of ``body`` can reach (stops counting
+        past the body length, which is all the callers need)"""
+        adjacent = self.adjacent
+        blocked = set(body)
+        seen = {body[0]}
+        stack = [body[0]]
+        limit = len(body) + 1
+        while stack and len(seen) <= limit:
+            for nxt in adjacent[stack.pop()]:
+                if nxt not in seen and nxt not in blocked:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return len(seen) - 1
+
+    def _tail_reachable(self, body):
+        """Can the head of ``body`` (head first) still reach its tail?"""
+        if len(body) < 3:
+            return True
+        return self._reachable(body[0], body[-1], set(body))
+
+    def _plan(self):
+        engine = self.engine
+        if engine.food is None:
+            return None
+        self.plans += 1
+        body = engine.body
+        blocked = set(body)
+        blocked.discard(body[-1])  # the tail moves on as the head advances
+        path = self._search(body[0], engine.food, blocked)
+        if path is None:
+            return None
+        # Where the snake will lie after eating: the path, then as much of
+        # the old body as still fits (it grows by one)
+        after = list(reversed(path))
+        after.extend(body[i] for i in range(max(len(body) + 1 - len(after), 0)))
+        after = after[:len(body) + 1]
+        if self._tail_reachable(after):
+            return path
+        # Tail-chasing can settle into a loop that never frees the food.
+        # After a full board's worth of fallback moves, settle for enough
+        # open space around the food instead of a way back to the tail.
+        if self.stuck > len(self.adjacent) and self._room(after) > len(after):
+            return path
+        return None
+
+    def _fallback(self):
+        engine = self.engine
+        body = engine.body
+        head, tail = body[0], body[-1]
+        is_free = engine.free_cells.is_free
+        moves = [cell for cell in self.adjacent[head] if is_free(cell) or cell == tail]
+        if not moves:
+            return engine.direction  # boxed in; nothing can save this one
+        self.stuck += 1
+        successor = None
+        if self.cycle_next is not None:
+            successor = self.cycle_next[head]
+            if successor in moves:
+                if self._cycle_ordered(body):
+                    self.ordered = True
+                    return self._cycle_step()
+                moves.remove(successor)
+                moves.insert(0, successor)
+        rest = list(body)
+        for cell in moves:
+            ate = cell == engine.food
+            after = [cell] + (rest if ate else rest[:-1])
+            if self._tail_reachable(after):
+                return self.direction_of[cell - head]
+        return self.direction_of[moves[0] - head]
+
+
+# -------------------------------
+# Headless soak test
+# -------------------------------
+def soak(games=100, cols=40, rows=30, seed=0, max_idle=None):
+    """Play ``games`` autopilot games, checking engine invariants on every
+    tick. Games that go ``max_idle`` ticks without eating are stopped."""
+    max_idle = max_idle or cols * rows * 2
+    totals = {"games": games, "moves": 0, "wins": 0, "deaths": 0, "stalls": 0,
+              "plans": 0, "fallbacks": 0, "scores": []}
+    engine = SnakeEngine(cols, rows)
+    start = time.perf_counter()
+    for game in range(games):
+        engine.reset(seed + game)
+        pilot = Autopilot(engine)
+        step = engine.step
+        next_action = pilot.next_action
+        idle = 0
+        while True:
+            state, reward, done = step(next_action())
+            totals["moves"] += 1
+            idle = 0 if reward else idle + 1
+            if done or idle >= max_idle:
+                break
+            assert len(engine.body) == engine.length + engine.score // POINTS_PER_FOOD
+            assert len(engine.free_cells) == cols * rows - len(engine.body)
+            assert state.food is None or engine.free_cells.is_free(state.food)
+        assert len(set(engine.body)) == len(engine.body)
+        if engine.food is None:
+            totals["wins"] += 1
+        elif done:
+            totals["deaths"] += 1
+        else:
+            totals["stalls"] += 1
+        totals["plans"] += pilot.plans
+        totals["fallbacks"] += pilot.fallbacks
+        totals["scores"].append(engine.score)
+    totals["seconds"] = time.perf_counter() - start
+    totals["moves_per_s"] = totals["moves"] / totals["seconds"]
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak-test the engine with the autopilot")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--cols", type=int, default=40)
+    parser.add_argument("--rows", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    totals = soak(args.games, args.cols, args.rows, args.seed)
+    scores = totals["scores"]
+    print(f"🤖 {totals['games']} games, {totals['moves']:,} moves in {totals['seconds']:.2f} s "
+          f"({totals['moves_per_s']:,.0f} moves/s)")
+    print(f"   score avg {sum(scores) / len(scores):.0f}, max {max(scores)}; "
+          f"{totals['wins']} filled the board, {totals['deaths']} died, {totals['stalls']} stalled")
+    print(f"   {totals['plans']:,} path searches, {totals['fallbacks']:,} fallback moves")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Game-steps per second of the vectorized batch engine vs the per-game engine.
+
+Run from the project root:  python benchmarks/bench_batch.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_batch import SnakeBatch
+from snake_engine import SnakeEngine
+
+TICKS = 200
+
+
+def bench_engine(ticks=TICKS * 100):
+    engine = SnakeEngine(40, 30, seed=0)
+    actions = np.random.default_rng(0).integers(0, 4, ticks).tolist()
+    start = time.perf_counter()
+    for action in actions:
+        if engine.step(action)[2]:
+            engine.reset()
+    return ticks / (time.perf_counter() - start)
+
+
+def bench_batch(n, ticks=TICKS):
+    batch = SnakeBatch(n, 40, 30, seed=0)
+    actions = np.random.default_rng(0).integers(0, 4, (ticks, n))
+    start = time.perf_counter()
+    for row in actions:
+        batch.step(row)
+    return ticks * n / (time.perf_counter() - start)
+
+
+def main():
+    print(f"{'engine':>12} {'games':>6} {'steps/s':>12}")
+    print(f"{'SnakeEngine':>12} {1:>6} {bench_engine():>12,.0f}")
+    for n in (1, 64, 1024, 4096):
+        print(f"{'SnakeBatch':>12} {n:>6} {bench_batch(n):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Food spawning at high board fill: free-cell index vs rejection sampling.
+
+Run from the project root:  python benchmarks/bench_food_spawn.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from free_cells import FreeCells
+
+COLS, ROWS = 40, 30  # manual mode board
+
+
+def fill_board(fill, rng):
+    """Return a FreeCells and the matching occupied set at the given fill ratio"""
+    cells = FreeCells(COLS, ROWS)
+    occupied = set(rng.sample(range(cells.size), int(cells.size * fill)))
+    for cell in occupied:
+        cells.occupy(cell)
+    return cells, occupied
+
+
+def spawn_rejection(occupied, rng):
+    while True:
+        cell = rng.randrange(COLS * ROWS)
+        if cell not in occupied:
+            return cell
+
+
+def bench(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e9
+
+
+def main(repeat=200_000):
+    rng = random.Random(0)
+    print(f"{'fill':>6} {'free cells':>12} {'index ns':>10} {'rejection ns':>14}")
+    for fill in (0.0, 0.5, 0.9, 0.99):
+        cells, occupied = fill_board(fill, rng)
+        free_ns = bench(lambda: cells.sample(rng), repeat)
+        reject_ns = bench(lambda: spawn_rejection(occupied, rng), repeat // 10)
+        print(f"{fill:>6.0%} {len(cells):>12} {free_ns:>10.0f} {reject_ns:>14.0f}")
+
+    # Uniformity check at 99% fill: every empty cell should be drawn equally often
+    cells, _ = fill_board(0.99, rng)
+    counts = {}
+    draws = 120_000
+    for _ in range(draws):
+        cell = cells.sample(rng)
+        counts[cell] = counts.get(cell, 0) + 1
+    expected = draws / len(cells)
+    spread = max(abs(c - expected) / expected for c in counts.values())
+    print(f"99% fill: {len(counts)}/{len(cells)} cells drawn, max deviation {spread:.1%}")
+
+
+if __name__ == "__main__":
+    main()
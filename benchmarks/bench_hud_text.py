@@ -0,0 +1,52 @@
+"""Per-frame cost of the gesture-mode HUD text: SysFont + render vs text_cache.
+
+Run from the project root:  python benchmarks/bench_hud_text.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import text_cache
+
+FRAMES = 300
+WHITE = (255, 255, 255)
+YELLOW = (255, 255, 0)
+
+
+def hud_uncached(screen, score, message):
+    font = pygame.font.SysFont("Poppins", 26)
+    screen.blit(font.render(f"Score: {score}", True, WHITE), (10, 10))
+    msg_font = pygame.font.SysFont("Poppins", 34, bold=True)
+    screen.blit(msg_font.render(message, True, YELLOW), (200, 300))
+
+
+def hud_cached(screen, score, message):
+    screen.blit(text_cache.render_text(f"Score: {score}", 26, WHITE), (10, 10))
+    screen.blit(text_cache.render_text(message, 34, YELLOW, bold=True), (200, 300))
+
+
+def bench(draw, screen):
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        draw(screen, (frame // 50) * 10, "Show Fist to Start")  # score changes now and then
+    return (time.perf_counter() - start) / FRAMES * 1e6
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((600, 600))
+    uncached = bench(hud_uncached, screen)
+    cached = bench(hud_cached, screen)
+    print(f"uncached HUD: {uncached:8.1f} us/frame")
+    print(f"cached HUD:   {cached:8.1f} us/frame")
+    print(f"saved:        {uncached - cached:8.1f} us/frame ({uncached / cached:.0f}x)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""Benchmark suite: simulation, rendering and gesture decoding.
+
+Run everything from the project root with one command::
+
+    python benchmarks/run.py                    # run, write results, compare to baseline
+    python benchmarks/run.py --save-baseline    # store this run as the new baseline
+    python benchmarks/run.py --video clip.mp4   # decode a recorded clip instead of noise
+
+Every metric is a rate (higher is better) and keeps its best of
+``--repeat`` rounds, each run in a fresh process: speed differs far more
+from one process to the next (memory layout, which core it lands on) than
+within one, so repeating inside a single process cannot smooth it out.
+Results go to ``benchmarks/results.json``. Metrics that fall further below
+``benchmarks/baseline.json`` than their tolerance (``TOLERANCES``, or
+``--tolerance`` for all of them) are reported and make the run exit 1.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+# Renderers run off-screen and silent
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import random
+from collections import deque
+
+from autopilot import hamiltonian_cycle, soak
+from bench_food_spawn import fill_board
+from snake_engine import OFFSETS, SnakeEngine
+
+RESULTS_PATH = os.path.join(BENCH_DIR, "results.json")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+SNAKE_LENGTHS = (3, 100, 500, 1000)
+# Allowed slowdown vs baseline, by metric name prefix. Whole games, frame
+# presentation and MediaPipe's own threads wander more between runs than
+# the tight simulation loops.
+DEFAULT_TOLERANCE = 0.10
+TOLERANCES = {
+    "sim.autopilot": 0.15,
+    "render.": 0.15,
+    "gesture.detect_fps": 0.25,
+}
+
+
+def rate(fn, count, min_time=0.2):
+    """Calls of fn per second; fn performs ``count`` operations per call"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls * count / elapsed
+
+
+# -------------------------------
+# Simulation
+# -------------------------------
+def snake_on_cycle(length, cols=40, rows=30):
+    """An engine whose snake of ``length`` lies along a Hamiltonian cycle, and
+    a function giving the action that moves it one cell further round. There
+    is no food, so the length stays fixed and the snake can never die."""
+    cycle = hamiltonian_cycle(cols, rows)
+    engine = SnakeEngine(cols, rows, seed=0)
+    for cell in engine.body:
+        engine.free_cells.release(cell)
+    engine.body = deque(reversed(cycle[:length]))  # head first
+    for cell in engine.body:
+        engine.free_cells.occupy(cell)
+    engine.head_x, engine.head_y = engine.xy(engine.body[0])
+    engine.food = None
+
+    actions = {}
+    for i, cell in enumerate(cycle):
+        (x0, y0), (x1, y1) = engine.xy(cell), engine.xy(cycle[(i + 1) % len(cycle)])
+        actions[cell] = OFFSETS.index((x1 - x0, y1 - y0))
+    engine.direction = actions[cycle[length - 2]]
+
+    def next_action():
+        return actions[engine.body[0]]
+    return engine, next_action
+
+
+def bench_simulation(results):
+    for length in SNAKE_LENGTHS:
+        engine, next_action = snake_on_cycle(length)
+
+        def run():
+            for _ in range(1000):
+                engine.step(next_action())
+        results[f"sim.ticks_per_s.len{length}"] = rate(run, 1000)
+        assert not engine.done and len(engine.body) == length
+
+    rng = random.Random(0)
+    for fill in (0.5, 0.99):
+        cells, _ = fill_board(fill, rng)
+        results[f"sim.spawn_food_per_s.fill{int(fill * 100)}"] = rate(
+            lambda: [cells.sample(rng) for _ in range(1000)], 1000)
+
+    # Whole games played to a full board, search included
+    results["sim.autopilot_moves_per_s"] = soak(games=5, cols=20, rows=20)["moves_per_s"]
+
+
+# -------------------------------
+# Rendering
+# -------------------------------
+def bench_render_manual(results):
+    import pygame
+    import manual_snake_game as manual
+
+    manual.open_window()
+    for length in SNAKE_LENGTHS:
+        game = manual.SnakeGame()
+        engine, next_action = snake_on_cycle(length, manual.GRID_COLS, manual.GRID_ROWS)
+        game.engine = engine
+        game.draw_full()
+        pygame.display.update()
+
+        def frame():
+            game.direction = next_action()
+            game.move()
+            pygame.display.update(game.draw_dirty())
+        results[f"render.manual_fps.len{length}"] = rate(lambda: [frame() for _ in range(20)], 20)
+        assert not engine.done
+    pygame.mixer.music.stop()
+
+
+def bench_render_gesture(results):
+    import gesture_snake_game as gesture
+
+    for length in SNAKE_LENGTHS[:3]:  # the 30x30 board holds 900 cells
+        game = gesture.SnakeGame()
+        engine, next_action = snake_on_cycle(length, game.engine.cols, game.engine.rows)
+        game.engine = engine
+        game.active = game.countdown_done = True
+
+        def frame():
+            game.direction = next_action()
+            game.move()
+            game.draw("", 0.5)
+        results[f"render.gesture_fps.len{length}"] = rate(lambda: [frame() for _ in range(20)], 20)
+        assert not engine.done
+    gesture.pygame.mixer.music.stop()
+
+
+def bench_render_huge(results):
+    import pygame
+    import huge_board
+
+    screen = pygame.display.set_mode((huge_board.SCREEN_WIDTH, huge_board.SCREEN_HEIGHT))
+    engine = SnakeEngine(10000, 10000, seed=0)
+    next_action = huge_board.lay_snake(engine, 100000)
+    renderer = huge_board.ChunkRenderer(engine)
+
+    def frame():
+        state, _, _ = engine.step(next_action())
+        renderer.cell_changed(state.head)
+        if state.tail is not None:
+            renderer.cell_changed(state.tail)
+        renderer.follow(engine.body[0])
+        renderer.draw(screen)
+        pygame.display.flip()
+    results["render.huge_fps.10000x10000.len100000"] = rate(
+        lambda: [frame() for _ in range(20)], 20)
+    assert not engine.done
+
+
+# -------------------------------
+# Gesture decoding
+# -------------------------------
+def bench_gesture_decode(results, video=None):
+    import numpy as np
+    from gesture_controller import GestureController
+
+    # Landmark decoding alone: a hand held still with tracking jitter
+    rng = np.random.default_rng(0)
+    points = np.full((300, 21, 3), 0.5, dtype=np.float32)
+    points[:, :, :2] += rng.normal(0, 0.008, (300, 1, 2)).astype(np.float32)
+    decoder = GestureController(load_model=False)
+    results["gesture.update_per_s"] = rate(lambda: [decoder.update(p) for p in points], len(points))
+
+    if video:
+        from gesture_replay import replay
+        results["gesture.detect_fps.video"] = replay(video)["fps"]
+        return
+    # Without a recording, time the full no-hand search on fixed noise frames
+    frames = [rng.integers(0, 255, (480, 640, 3), dtype=np.uint8) for _ in range(10)]
+    controller = GestureController()
+    controller.wait_ready()
+    controller.detect_gesture(frames[0])  # warm up at this frame size
+    results["gesture.detect_fps.noise"] = rate(
+        lambda: [controller.detect_gesture(f) for f in frames], len(frames), min_time=1.0)
+
+
+# -------------------------------
+# Baseline comparison
+# -------------------------------
+def tolerance_for(name):
+    for prefix, tolerance in TOLERANCES.items():
+        if name.startswith(prefix):
+            return tolerance
+    return DEFAULT_TOLERANCE
+
+
+def compare(results, baseline, tolerance=None):
+    """Print each metric against the baseline and return those that regressed.
+    ``tolerance`` overrides the per-metric tolerances when given."""
+    regressions = []
+    for name, value in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None:
+            print(f"  {name:<36}{value:>14,.1f}   (new)")
+            continue
+        change = value / base - 1
+        allowed = tolerance if tolerance is not None else tolerance_for(name)
+        flag = "  REGRESSION" if change < -allowed else ""
+        print(f"  {name:<36}{value:>14,.1f} {change:>+8.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def run_round(groups, video):
+    """One round of the selected groups in this process; returns the results
+    and the reasons any group was skipped"""
+    results, skipped = {}, []
+    if "sim" in groups:
+        bench_simulation(results)
+    if "render" in groups:
+        bench_render_manual(results)
+        bench_render_gesture(results)
+        bench_render_huge(results)
+    if "gesture" in groups:
+        try:
+            bench_gesture_decode(results, video)
+        except (ImportError, RuntimeError) as e:
+            # MediaPipe loads on a background thread; wait_ready() re-raises
+            # its failure as RuntimeError
+            skipped.append(f"Skipping gesture decoding: {e.__cause__ or e}")
+    return results, skipped
+
+
+def best_of_rounds(groups, video, repeat):
+    """Run ``repeat`` rounds in worker processes, keeping each metric's best"""
+    results, skipped = {}, []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "round.json")
+        for _ in range(repeat):
+            cmd = [sys.executable, os.path.abspath(__file__), "--worker", path]
+            cmd += [f"--only={group}" for group in groups]
+            if video:
+                cmd += ["--video", video]
+            subprocess.run(cmd, check=True)
+            with open(path) as f:
+                round_results = json.load(f)
+            for name, value in round_results["results"].items():
+                results[name] = max(value, results.get(name, 0))
+            skipped += [s for s in round_results["skipped"] if s not in skipped]
+    for reason in skipped:
+        print(reason)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake benchmark suite")
+    parser.add_argument("--only", choices=("sim", "render", "gesture"), action="append",
+                        help="run only these groups (repeatable)")
+    parser.add_argument("--video", default=None, help="recorded clip for gesture decoding")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="allowed slowdown vs baseline for every metric "
+                             "(default: per metric, 10%% unless listed in TOLERANCES)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="rounds, each in a fresh process; metrics keep their best (default 5)")
+    parser.add_argument("--worker", metavar="PATH", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    groups = args.only or ["sim", "render", "gesture"]
+
+    if args.worker:
+        results, skipped = run_round(groups, args.video)
+        with open(args.worker, "w") as f:
+            json.dump({"results": results, "skipped": skipped}, f)
+        return
+    results = best_of_rounds(groups, args.video, args.repeat)
+
+    with open(RESULTS_PATH, "w") as f:
+        json.dump({"machine": platform.platform(), "python": platform.python_version(),
+                   "results": results}, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH) and not args.save_baseline:
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump({"machine": platform.platform(), "python": platform.python_version(),
+                       "results": results}, f, indent=2)
+        print(f"Baseline saved to {BASELINE_PATH}")
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed beyond their tolerance")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import random
+
+# Rejection sampling needs about size / free tries; below this free fraction
+# sample() counts set bits instead
+MIN_FREE_FRACTION = 1 / 32
+SCAN_CHUNK = 1 << 16  # bytes popcounted at a time when scanning
+
+
+# -------------------------------
+# Bit-grid occupancy
+# -------------------------------
+class BitGrid:
+    """Occupancy with one bit per cell, for boards too big for FreeCells.
+
+    Same interface as ``free_cells.FreeCells`` (``is_free``, ``occupy``,
+    ``release``, ``sample``, ``len``), so SnakeEngine can use either. A
+    10,000 x 10,000 board takes 12.5 MB. Food is placed by rejection
+    sampling while the board is mostly empty and by a popcount scan when it
+    is nearly full, both uniform over the free cells.
+    """
+
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.size = cols * rows
+        self.bits = bytearray((self.size + 7) >> 3)
+        self.free = self.size
+
+    def __len__(self):
+        return self.free
+
+    def index(self, col, row):
+        return row * self.cols + col
+
+    def is_free(self, cell):
+        return not self.bits[cell >> 3] >> (cell & 7) & 1
+
+    def occupy(self, cell):
+        mask = 1 << (cell & 7)
+        if not self.bits[cell >> 3] & mask:
+            self.bits[cell >> 3] |= mask
+            self.free -= 1
+
+    def release(self, cell):
+        mask = 1 << (cell & 7)
+        if self.bits[cell >> 3] & mask:
+            self.bits[cell >> 3] &= ~mask
+            self.free += 1
+
+    def sample(self, rng=random):
+        """Return a uniformly random empty cell, or None if the board is full"""
+        if not self.free:
+            return None
+        if self.free >= self.size * MIN_FREE_FRACTION:
+            while True:
+                cell = int(rng.random() * self.size)
+                if not self.bits[cell >> 3] >> (cell & 7) & 1:
+                    return cell
+        return self._nth_free(int(rng.random() * self.free))
+
+    def _nth_free(self, n):
+        """The n-th free cell in board order"""
+        bits = self.bits
+        for start in range(0, len(bits), SCAN_CHUNK):
+            chunk = bits[start:start + SCAN_CHUNK]
+            free = len(chunk) * 8 - int.from_bytes(chunk, "little").bit_count()
+            if start + len(chunk) == len(bits):
+                free -= len(bits) * 8 - self.size  # padding bits past the board
+            if n >= free:
+                n -= free
+                continue
+            for offset, byte in enumerate(chunk):
+                free = 8 - bin(byte).count("1")
+                if n >= free:
+                    n -= free
+                    continue
+                cell = (start + offset) << 3
+                while True:
+                    if not byte & 1:
+                        if n == 0:
+                            return cell
+                        n -= 1
+                    byte >>= 1
+                    cell += 1
+        return None
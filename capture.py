@@ -0,0 +1,216 @@
+import threading
+import time
+
+import cv2
+import numpy as np
+
+
+# -------------------------------
+# Threaded camera capture
+# -------------------------------
+class LatestFrameCapture:
+    """Reads a ``cv2.VideoCapture`` on a background thread, keeping only the
+    newest frame so the game loop never blocks on the camera or sees a
+    backlog of stale frames.
+    """
+
+    provides_landmarks = False
+    finished = False  # a live camera never runs out
+
+    def __init__(self, source=0, timer=None):
+        self.timer = timer  # optional perf_stats.StageTimer
+        self.cap = cv2.VideoCapture(source)
+        # Ask the driver not to queue frames on its side either
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._frame = None
+        self._captured_at = 0.0
+        self._fresh = False
+        self.running = False
+
+        # Counters
+        self.frames_captured = 0
+        self.frames_used = 0
+        self.frames_dropped = 0  # overwritten before the game loop read them
+        self.total_age = 0.0
+        self.max_age = 0.0
+
+    def is_opened(self):
+        return self.cap.isOpened()
+
+    def start(self):
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while self.running:
+            start = time.perf_counter()
+            ret, frame = self.cap.read()
+            if self.timer is not None:
+                self.timer.record("cap.read", start)
+            if not ret:
+                time.sleep(0.005)
+                continue
+            captured_at = time.perf_counter()
+            with self._lock:
+                if self._fresh:
+                    self.frames_dropped += 1
+                self._frame = frame
+                self._captured_at = captured_at
+                self._fresh = True
+                self.frames_captured += 1
+
+    def get_latest(self):
+        """Return ``(frame, captured_at)`` for the newest unseen frame, or
+        ``(None, None)`` if nothing new arrived since the last call."""
+        with self._lock:
+            if not self._fresh:
+                return None, None
+            frame, captured_at = self._frame, self._captured_at
+            self._fresh = False
+        age = time.perf_counter() - captured_at
+        self.frames_used += 1
+        self.total_age += age
+        self.max_age = max(self.max_age, age)
+        return frame, captured_at
+
+    def stats(self):
+        used = self.frames_used or 1
+        return {
+            "captured": self.frames_captured,
+            "used": self.frames_used,
+            "dropped": self.frames_dropped,
+            "avg_age_ms": self.total_age / used * 1000,
+            "max_age_ms": self.max_age * 1000,
+        }
+
+    def release(self):
+        self.running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.cap.release()
+
+
+# -------------------------------
+# Offline sources
+# -------------------------------
+class _PacedSource:
+    """Shared pacing for recorded sources: with ``realtime`` a sample is only
+    handed out once its timestamp is due, otherwise every call returns the
+    next one so the pipeline runs as fast as it can."""
+
+    provides_landmarks = False
+
+    def __init__(self, fps, realtime):
+        self.fps = fps or 30.0
+        self.realtime = realtime
+        self.index = 0
+        self.finished = False
+        self.started = None
+        self.frames_used = 0
+
+    def start(self):
+        self.started = time.perf_counter()
+        return self
+
+    def _due(self):
+        if not self.realtime:
+            return True
+        return time.perf_counter() - self.started >= self.index / self.fps
+
+    def stats(self):
+        return {"captured": self.index, "used": self.frames_used, "dropped": 0,
+                "avg_age_ms": 0.0, "max_age_ms": 0.0}
+
+
+class VideoFileSource(_PacedSource):
+    """Frames from a recorded video file, with the LatestFrameCapture interface"""
+
+    def __init__(self, path, realtime=True, timer=None):
+        self.cap = cv2.VideoCapture(path)
+        super().__init__(self.cap.get(cv2.CAP_PROP_FPS), realtime)
+        self.timer = timer
+
+    def is_opened(self):
+        return self.cap.isOpened()
+
+    def get_latest(self):
+        if self.finished or not self._due():
+            return None, None
+        start = time.perf_counter()
+        ret, frame = self.cap.read()
+        if self.timer is not None:
+            self.timer.record("cap.read", start)
+        if not ret:
+            self.finished = True
+            return None, None
+        self.index += 1
+        self.frames_used += 1
+        return frame, time.perf_counter()
+
+    def release(self):
+        self.cap.release()
+
+
+class LandmarkReplaySource(_PacedSource):
+    """Pre-extracted hand landmarks from an NPZ file, skipping the camera and
+    MediaPipe entirely.
+
+    The file holds ``landmarks`` (N, 21, 3) float32 in normalized
+    full-frame coordinates, ``present`` (N,) bool and optionally ``fps`` and
+    per-frame expected ``directions``. ``get_latest`` returns a (21, 3) array,
+    an empty (0, 3) array for a frame without a hand, or None when no new
+    sample is due.
+    """
+
+    provides_landmarks = True
+    NO_HAND = np.empty((0, 3), dtype=np.float32)
+
+    def __init__(self, path, realtime=True, timer=None):
+        data = np.load(path)
+        self.landmarks = data["landmarks"]
+        self.present = data["present"] if "present" in data else np.ones(len(self.landmarks), bool)
+        self.directions = data["directions"] if "directions" in data else None
+        super().__init__(float(data["fps"]) if "fps" in data else None, realtime)
+
+    def is_opened(self):
+        return len(self.landmarks) > 0
+
+    def get_latest(self):
+        if self.finished or not self._due():
+            return None, None
+        if self.index >= len(self.landmarks):
+            self.finished = True
+            return None, None
+        i = self.index
+        self.index += 1
+        self.frames_used += 1
+        points = self.landmarks[i] if self.present[i] else self.NO_HAND
+        return points, time.perf_counter()
+
+    def release(self):
+        pass
+
+
+def save_landmarks(path, landmarks, present, fps=30.0, directions=None):
+    """Write a landmark stream in the format LandmarkReplaySource reads"""
+    arrays = {
+        "landmarks": np.asarray(landmarks, dtype=np.float32).reshape(-1, 21, 3),
+        "present": np.asarray(present, dtype=bool),
+        "fps": np.float32(fps),
+    }
+    if directions is not None:
+        arrays["directions"] = np.asarray(directions, dtype="U5")
+    np.savez_compressed(path, **arrays)
+
+
+def open_source(video=None, landmarks=None, realtime=True, timer=None):
+    """Webcam by default, or a recorded video / landmark file"""
+    if landmarks:
+        return LandmarkReplaySource(landmarks, realtime=realtime, timer=timer)
+    if video:
+        return VideoFileSource(video, realtime=realtime, timer=timer)
+    return LatestFrameCapture(0, timer=timer)
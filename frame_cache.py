@@ -0,0 +1,170 @@
+"""Pre-scaled animation frames cached on disk for the Tk home screen.
+
+Scaling every GIF frame with LANCZOS is slow, so the scaled frames are
+written once as raw RGB to ``.cache/`` under a name keyed by the GIF's
+path, size and modification time and the target size. Later launches map
+that file and only copy out the frames actually shown. Raw frames cost
+width * height * 3 bytes each (1.44 MB at 800x600), so a long GIF's cache
+runs to hundreds of MB on disk::
+
+    frames = AnimationFrames(gif_path, (800, 600))
+    photo = frames.photo(0)   # on the Tk thread; None until frame 0 is ready
+"""
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+from PIL import Image, ImageSequence, ImageTk
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, ".cache", "frames")
+
+MAGIC = b"SNKF"
+# magic, width, height, frame count; then width * height * 3 bytes per frame
+HEADER = struct.Struct("<4sHHI")
+# PhotoImages kept alive at once; older ones are rebuilt from the cache
+MAX_RESIDENT = 64
+
+
+def scale_to_cover(img, size):
+    """Resize ``img`` to fill ``size`` and crop the overflow around the centre"""
+    width, height = size
+    img_ratio = img.width / img.height
+    if img_ratio > width / height:
+        new_height = height
+        new_width = int(new_height * img_ratio)
+    else:
+        new_width = width
+        new_height = int(new_width / img_ratio)
+    resized = img.convert("RGB").resize((new_width, new_height), Image.LANCZOS)
+    left = (resized.width - width) // 2
+    top = (resized.height - height) // 2
+    return resized.crop((left, top, left + width, top + height))
+
+
+def cache_path(gif_path, size, cache_dir=CACHE_DIR):
+    """Cache file for ``gif_path`` scaled to ``size``. Keyed on the file's
+    stat rather than its contents: this runs on the Tk thread, and hashing
+    a large GIF there stalls the window."""
+    stat = os.stat(gif_path)
+    key = f"{os.path.abspath(gif_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{digest}-{size[0]}x{size[1]}.frames")
+
+
+class AnimationFrames:
+    """Frames of a GIF scaled to ``size``, loaded from the disk cache or
+    decoded on a background thread (which also writes the cache). Frames
+    shown while decoding is still running are read back from the partly
+    written file, so no raw frames pile up in memory.
+
+    ``photo`` must be called from the Tk thread; it only ever holds
+    ``max_resident`` PhotoImages."""
+
+    def __init__(self, gif_path, size, cache_dir=CACHE_DIR, max_resident=MAX_RESIDENT):
+        self.size = tuple(size)
+        self.frame_bytes = self.size[0] * self.size[1] * 3
+        self.max_resident = max_resident
+        self.photos = OrderedDict()  # index -> PhotoImage, least recent first
+        self.tmp = None  # cache file being written by the first decode
+        self._reader = None  # read handle on self.tmp, opened by raw()
+        self.count = 0  # frames ready so far
+        self.done = False
+        self.error = None
+        self._map = None
+        self._lock = threading.Lock()
+
+        self.path = cache_path(gif_path, self.size, cache_dir)
+        if not self._open_cache():
+            threading.Thread(target=self._decode, args=(gif_path,),
+                             name="gif-decode", daemon=True).start()
+
+    def _open_cache(self):
+        try:
+            with open(self.path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        if len(data) < HEADER.size:
+            data.close()
+            return False
+        magic, width, height, count = HEADER.unpack_from(data)
+        if (magic != MAGIC or (width, height) != self.size
+                or len(data) != HEADER.size + count * self.frame_bytes):
+            data.close()
+            return False
+        self._map = data
+        self.count = count
+        self.done = True
+        return True
+
+    def _decode(self, gif_path):
+        tmp = self.tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, "wb") as out:
+                out.write(HEADER.pack(MAGIC, *self.size, 0))
+                for img in ImageSequence.Iterator(Image.open(gif_path)):
+                    out.write(scale_to_cover(img, self.size).tobytes())
+                    out.flush()  # readable by raw() before it is counted
+                    with self._lock:
+                        self.count += 1
+                out.seek(0)
+                out.write(HEADER.pack(MAGIC, *self.size, self.count))
+            with self._lock:
+                self._close_reader()  # Windows can't replace an open file
+                os.replace(tmp, self.path)
+                self.tmp = None
+        except Exception as e:  # a broken GIF just means no animation
+            self.error = e
+            print("Animation Error:", e)
+            with self._lock:
+                self._close_reader()
+                self.count = 0
+                self.tmp = None
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        self.done = True
+
+    def _close_reader(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def raw(self, index):
+        """RGB bytes of one frame"""
+        if self._map is not None:
+            start = HEADER.size + index * self.frame_bytes
+            return self._map[start:start + self.frame_bytes]
+        with self._lock:
+            if self.tmp is not None:
+                if index >= self.count:
+                    return None
+                if self._reader is None:
+                    self._reader = open(self.tmp, "rb")
+                self._reader.seek(HEADER.size + index * self.frame_bytes)
+                return self._reader.read(self.frame_bytes)
+        # Decoding has finished: serve from the mapped cache from now on
+        if self.error is None and self._open_cache():
+            return self.raw(index)
+        return None
+
+    def photo(self, index):
+        """PhotoImage for frame ``index``, or None if it isn't decoded yet"""
+        photo = self.photos.get(index)
+        if photo is not None:
+            self.photos.move_to_end(index)
+            return photo
+        if index >= self.count:
+            return None
+        raw = self.raw(index)
+        if raw is None:
+            return None
+        image = Image.frombuffer("RGB", self.size, raw, "raw", "RGB", 0, 1)
+        photo = self.photos[index] = ImageTk.PhotoImage(image)
+        if len(self.photos) > self.max_resident:
+            self.photos.popitem(last=False)
+        return photo
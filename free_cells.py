@@ -0,0 +1,53 @@
+import random
+
+
+# -------------------------------
+# Free-cell index
+# -------------------------------
+class FreeCells:
+    """Set of empty grid cells with O(1) occupy, release and uniform sampling.
+
+    Cells are numbered ``row * cols + col``. ``cells[:free]`` holds every
+    empty cell and ``cells[free:]`` every occupied one; ``pos`` maps a cell
+    back to its slot, so both updates are a single swap.
+    """
+
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.size = cols * rows
+        self.cells = list(range(self.size))
+        self.pos = list(range(self.size))
+        self.free = self.size
+
+    def __len__(self):
+        return self.free
+
+    def index(self, col, row):
+        return row * self.cols + col
+
+    def is_free(self, cell):
+        return self.pos[cell] < self.free
+
+    def _swap(self, cell, slot):
+        cells, pos = self.cells, self.pos
+        other = cells[slot]
+        old = pos[cell]
+        cells[old], cells[slot] = other, cell
+        pos[other], pos[cell] = old, slot
+
+    def occupy(self, cell):
+        if self.pos[cell] < self.free:
+            self.free -= 1
+            self._swap(cell, self.free)
+
+    def release(self, cell):
+        if self.pos[cell] >= self.free:
+            self._swap(cell, self.free)
+            self.free += 1
+
+    def sample(self, rng=random):
+        """Return a uniformly random empty cell, or None if the board is full"""
+        if not self.free:
+            return None
+        return self.cells[int(rng.random() * self.free)]
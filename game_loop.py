@@ -0,0 +1,47 @@
+import time
+
+
+# -------------------------------
+# Fixed-timestep scheduler
+# -------------------------------
+class FixedStepClock:
+    """Accumulator-based fixed timestep.
+
+    The simulation advances at ``tick_rate`` steps per second of real time
+    no matter how fast frames are rendered: each frame asks ``advance()``
+    how many steps are due and runs them. A slow frame just means several
+    steps before the next render (frames are skipped, the game does not slow
+    down). ``max_steps`` only guards against long stalls such as a dragged
+    window; time beyond it is dropped and counted in ``dropped_steps``.
+    """
+
+    def __init__(self, tick_rate, max_steps=10):
+        self.step_time = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.last = time.perf_counter()
+        self.steps = 0
+        self.frames = 0
+        self.dropped_steps = 0
+
+    def advance(self):
+        """Return the number of simulation steps due since the previous call"""
+        now = time.perf_counter()
+        self.accumulator += now - self.last
+        self.last = now
+        self.frames += 1
+
+        steps = int(self.accumulator / self.step_time)
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_time
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of the next step already elapsed, for interpolated drawing"""
+        return min(self.accumulator / self.step_time, 1.0)
@@ -0,0 +1,396 @@
+"""Asyncio game server hosting many snake sessions in one process.
+
+Every client gets its own SnakeEngine, and one scheduler task steps all
+live sessions on each tick. Clients connect over plain TCP. They send one
+byte per command (0-3 = UP/RIGHT/DOWN/LEFT, 4 = restart) and receive a
+snapshot once, then one small delta frame per tick::
+
+    python game_server.py serve --port 8765
+    python game_server.py load --clients 2000 --seconds 10   # localhost load test
+
+Delta frames are a flags byte and the new head, plus the vacated tail and
+the new food only when they exist (5-17 bytes). The body list is never
+resent.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import queue
+import struct
+import time
+from array import array
+from collections import deque
+
+from perf_stats import StageTimer
+from snake_engine import SnakeEngine
+
+TICK_RATE = 10
+BOARD = (40, 30)
+RESTART = 4
+NO_CELL = 0xFFFFFFFF
+MAX_WRITE_BUFFER = 64 * 1024  # a client this far behind is dropped
+
+# Frame flags
+TAIL = 0x01  # a tail cell was vacated (absent when the snake grew)
+FOOD = 0x02  # the food moved (NO_CELL when the board is full)
+DONE = 0x04  # game over; the final score follows
+SNAPSHOT = 0x80  # full state: cols, rows, food, length, body cells head first
+
+CELL = struct.Struct("<I")
+DELTA_HEAD = struct.Struct("<BI")
+SNAPSHOT_HEADER = struct.Struct("<BHHII")
+
+
+# -------------------------------
+# Protocol
+# -------------------------------
+def encode_snapshot(engine):
+    food = NO_CELL if engine.food is None else engine.food
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT, engine.cols, engine.rows, food, len(engine.body))
+    return header + array("I", engine.body).tobytes()
+
+
+def encode_delta(state, previous_food, done, score):
+    """One tick of a session; ``state`` is the engine's StepState. A losing
+    tick leaves the body as it was, so it carries no tail."""
+    flags = 0
+    extra = b""
+    if state.tail is not None and not done:
+        flags |= TAIL
+        extra += CELL.pack(state.tail)
+    if state.food != previous_food:
+        flags |= FOOD
+        extra += CELL.pack(NO_CELL if state.food is None else state.food)
+    if done:
+        flags |= DONE
+        extra += CELL.pack(score)
+    return DELTA_HEAD.pack(flags, state.head) + extra
+
+
+def decode_frames(buffer):
+    """Parse and remove the complete frames at the front of ``buffer`` (a
+    bytearray). Yields ``("snapshot", cols, rows, food, body)`` or
+    ``("delta", head, tail, food, score)`` with None for absent fields."""
+    offset = 0
+    while offset < len(buffer):
+        flags = buffer[offset]
+        if flags & SNAPSHOT:
+            if len(buffer) - offset < SNAPSHOT_HEADER.size:
+                break
+            _, cols, rows, food, length = SNAPSHOT_HEADER.unpack_from(buffer, offset)
+            start = offset + SNAPSHOT_HEADER.size
+            end = start + 4 * length
+            if len(buffer) < end:
+                break
+            body = array("I", bytes(buffer[start:end]))
+            yield ("snapshot", cols, rows, None if food == NO_CELL else food, body)
+            offset = end
+            continue
+        size = DELTA_HEAD.size + 4 * ((flags & TAIL) + (flags & FOOD) // FOOD + (flags & DONE) // DONE)
+        if len(buffer) - offset < size:
+            break
+        head = CELL.unpack_from(buffer, offset + 1)[0]
+        at = offset + DELTA_HEAD.size
+        tail = food = score = None
+        if flags & TAIL:
+            tail = CELL.unpack_from(buffer, at)[0]
+            at += 4
+        if flags & FOOD:
+            food = CELL.unpack_from(buffer, at)[0]
+            at += 4
+        if flags & DONE:
+            score = CELL.unpack_from(buffer, at)[0]
+        yield ("delta", head, tail, food, score)
+        offset += size
+    del buffer[:offset]
+
+
+# -------------------------------
+# Server
+# -------------------------------
+class Session:
+    __slots__ = ("engine", "writer", "action", "food")
+
+    def __init__(self, engine, writer):
+        self.engine = engine
+        self.writer = writer
+        self.action = None  # direction to apply on the next tick
+        self.food = engine.food  # last food sent to the client
+
+
+class GameServer:
+    """Hosts sessions and steps them all from one tick scheduler"""
+
+    def __init__(self, cols=BOARD[0], rows=BOARD[1], tick_rate=TICK_RATE):
+        self.cols = cols
+        self.rows = rows
+        self.tick_rate = tick_rate
+        self.sessions = set()
+        self.timer = StageTimer(window=10000)
+        self.ticks = 0
+        self.overruns = 0  # ticks skipped because stepping fell behind
+        self.dropped = 0  # clients disconnected for not reading
+        self.peak = 0  # most sessions seen at once
+
+    async def handle(self, reader, writer):
+        session = Session(SnakeEngine(self.cols, self.rows), writer)
+        self.sessions.add(session)
+        writer.write(encode_snapshot(session.engine))
+        try:
+            while True:
+                data = await reader.read(64)
+                if not data:
+                    break
+                for command in data:
+                    if command == RESTART:
+                        session.engine.reset()
+                        session.food = session.engine.food
+                        writer.write(encode_snapshot(session.engine))
+                    elif command < 4:
+                        session.action = command
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.discard(session)
+            writer.close()
+
+    def step_all(self):
+        for session in list(self.sessions):
+            engine = session.engine
+            if engine.done:
+                continue
+            state, _, done = engine.step(session.action)
+            session.action = None
+            writer = session.writer
+            writer.write(encode_delta(state, session.food, done, engine.score))
+            session.food = state.food
+            if writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                self.dropped += 1
+                self.sessions.discard(session)
+                writer.transport.abort()
+
+    async def tick_forever(self):
+        """Step every session on a fixed schedule. Deadlines are absolute,
+        so a late tick doesn't push back the ones after it."""
+        loop = asyncio.get_running_loop()
+        period = 1.0 / self.tick_rate
+        deadline = loop.time() + period
+        cpu = time.process_time()
+        while True:
+            await asyncio.sleep(max(deadline - loop.time(), 0))
+            start = loop.time()
+            self.timer.add("tick.jitter", (start - deadline) * 1000)
+            if self.sessions:
+                # CPU for the whole period, socket reads and writes included
+                self.timer.add("tick.cpu", (time.process_time() - cpu) * 1000)
+                self.peak = max(self.peak, len(self.sessions))
+            cpu = time.process_time()
+            self.step_all()
+            self.ticks += 1
+            self.timer.add("tick.step", (loop.time() - start) * 1000)
+            deadline += period
+            if loop.time() > deadline:
+                missed = int((loop.time() - deadline) / period) + 1
+                self.overruns += missed
+                deadline += missed * period
+
+    def stats(self):
+        summary = self.timer.summary()
+        return {
+            "sessions": len(self.sessions),
+            "peak_sessions": self.peak,
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "dropped": self.dropped,
+            "jitter_p50_ms": summary.get("tick.jitter", {}).get("p50", 0.0),
+            "jitter_p99_ms": summary.get("tick.jitter", {}).get("p99", 0.0),
+            "step_p50_ms": summary.get("tick.step", {}).get("p50", 0.0),
+            "step_p99_ms": summary.get("tick.step", {}).get("p99", 0.0),
+            "cpu_p50_ms": summary.get("tick.cpu", {}).get("p50", 0.0),
+        }
+
+
+def raise_fd_limit():
+    """Thousands of sockets need more than the usual 1024 descriptors"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def serve(host, port, cols, rows, tick_rate, stop=None, ready=None, report_every=5.0):
+    """Run a GameServer until ``stop`` (a threading/multiprocessing Event)
+    is set, setting ``ready`` once listening; returns its final stats"""
+    raise_fd_limit()
+    game = GameServer(cols, rows, tick_rate)
+    server = await asyncio.start_server(game.handle, host, port, backlog=4096)
+    ticker = asyncio.create_task(game.tick_forever())
+    print(f"🐍 Serving {cols}x{rows} snake at {tick_rate} ticks/s on {host}:{port}")
+    if ready is not None:
+        ready.set()
+    last_report = time.perf_counter()
+    try:
+        while stop is None or not stop.is_set():
+            await asyncio.sleep(0.1)
+            now = time.perf_counter()
+            if report_every and now - last_report >= report_every:
+                last_report = now
+                s = game.stats()
+                print(f"   {s['sessions']} sessions, step p50 {s['step_p50_ms']:.2f} ms, "
+                      f"jitter p50 {s['jitter_p50_ms']:.2f} / p99 {s['jitter_p99_ms']:.2f} ms")
+    finally:
+        ticker.cancel()
+        server.close()
+    return game.stats()
+
+
+def _serve_process(host, port, cols, rows, tick_rate, stop, ready, results):
+    results.put(asyncio.run(serve(host, port, cols, rows, tick_rate, stop, ready, report_every=0)))
+
+
+# -------------------------------
+# Load generator
+# -------------------------------
+async def play_client(host, port, period_ms, timer, counters, deadline, verify=False):
+    """One simulated player: circles the board clockwise along the walls and
+    restarts when it dies. Records how far the gap between frames strays
+    from the tick period as jitter."""
+    reader, writer = await asyncio.open_connection(host, port)
+    buffer = bytearray()
+    body = deque()
+    cols = rows = previous = 0
+    last = None
+    try:
+        while time.perf_counter() < deadline:
+            data = await reader.read(4096)
+            if not data:
+                break
+            now = time.perf_counter()
+            buffer += data
+            for frame in decode_frames(buffer):
+                if frame[0] == "snapshot":
+                    _, cols, rows, _, cells = frame
+                    body = deque(cells)
+                    previous, last = cells[0], None
+                    continue
+                _, head, tail, _, score = frame
+                counters["frames"] += 1
+                if last is not None:
+                    timer.add("client.jitter", abs((now - last) * 1000 - period_ms))
+                last = now
+                if score is not None:
+                    counters["games"] += 1
+                    writer.write(bytes((RESTART,)))
+                    continue
+                # Heading as the server applied it; a turn sent too late for
+                # the last tick shows up here rather than being assumed
+                direction = {-cols: 0, 1: 1, cols: 2, -1: 3}.get(head - previous)
+                previous = head
+                if verify:
+                    if direction is None:
+                        counters["mismatches"] += 1
+                    body.appendleft(head)
+                    if tail is not None and body.pop() != tail:
+                        counters["mismatches"] += 1
+                row, col = divmod(head, cols)
+                turn = (row == 0, col == cols - 1, row == rows - 1, col == 0)
+                if direction is not None and turn[direction]:
+                    direction = (direction + 1) % 4
+                    writer.write(bytes((direction,)))
+    except ConnectionError:
+        counters["disconnects"] += 1
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, clients, seconds, tick_rate, verify=False):
+    raise_fd_limit()
+    timer = StageTimer(window=200000)
+    counters = {"frames": 0, "games": 0, "mismatches": 0, "disconnects": 0}
+    deadline = time.perf_counter() + seconds
+    tasks = []
+    for i in range(clients):
+        tasks.append(asyncio.create_task(
+            play_client(host, port, 1000.0 / tick_rate, timer, counters, deadline, verify)))
+        if i % 200 == 199:
+            await asyncio.sleep(0)  # let the accept queue drain
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    counters["failed"] = sum(isinstance(r, Exception) for r in results)
+    return counters, timer.summary().get("client.jitter", {})
+
+
+def load_test(args):
+    stop = results = process = None
+    if not args.connect:
+        ctx = multiprocessing.get_context("spawn")
+        stop, ready, results = ctx.Event(), ctx.Event(), ctx.Queue()
+        process = ctx.Process(target=_serve_process, daemon=True,
+                              args=(args.host, args.port, args.cols, args.rows,
+                                    args.tick_rate, stop, ready, results))
+        process.start()
+        if not ready.wait(30):
+            print("❌ Server did not start")
+            return
+    counters, jitter = asyncio.run(run_load(args.host, args.port, args.clients, args.seconds,
+                                            args.tick_rate, args.verify))
+    expected = args.clients * args.seconds * args.tick_rate
+    print(f"📡 {args.clients} clients for {args.seconds:.0f} s: {counters['frames']:,} frames "
+          f"({counters['frames'] / expected:.0%} of {expected:,.0f}), {counters['games']} games, "
+          f"{counters['failed']} failed connections")
+    if jitter:
+        print(f"   client tick jitter p50 {jitter['p50']:.2f} / p95 {jitter['p95']:.2f} / "
+              f"p99 {jitter['p99']:.2f} ms")
+    if args.verify:
+        print(f"   delta mismatches: {counters['mismatches']}")
+    if process is None:
+        return
+    stop.set()
+    try:
+        stats = results.get(timeout=10)
+    except queue.Empty:
+        print("❌ Server did not report")
+        return
+    process.join(5)
+    print(f"🖥 Server: {stats['peak_sessions']} sessions, {stats['ticks']} ticks, "
+          f"{stats['overruns']} overruns, {stats['dropped']} dropped")
+    print(f"   step p50 {stats['step_p50_ms']:.2f} / p99 {stats['step_p99_ms']:.2f} ms, "
+          f"tick jitter p50 {stats['jitter_p50_ms']:.2f} / p99 {stats['jitter_p99_ms']:.2f} ms")
+    cores = stats["cpu_p50_ms"] / (1000.0 / args.tick_rate)
+    if cores:
+        print(f"   {cores:.2f} cores busy -> ~{stats['peak_sessions'] / cores:,.0f} sessions per core "
+              f"at {args.tick_rate} ticks/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-session snake server")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("serve", "load"):
+        p = sub.add_parser(name)
+        p.add_argument("--host", default="127.0.0.1")
+        p.add_argument("--port", type=int, default=8765)
+        p.add_argument("--cols", type=int, default=BOARD[0])
+        p.add_argument("--rows", type=int, default=BOARD[1])
+        p.add_argument("--tick-rate", type=int, default=TICK_RATE)
+    load = sub.choices["load"]
+    load.add_argument("--clients", type=int, default=1000)
+    load.add_argument("--seconds", type=float, default=10.0)
+    load.add_argument("--connect", action="store_true",
+                      help="load an already running server instead of starting one")
+    load.add_argument("--verify", action="store_true",
+                      help="mirror every snake from the deltas and check them")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args.host, args.port, args.cols, args.rows, args.tick_rate))
+        except KeyboardInterrupt:
+            pass
+    else:
+        load_test(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+import math
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+# MediaPipe takes seconds to import and build, so it is loaded on a
+# background thread (see GestureController._load) instead of at import time.
+
+# ROI tracking: the crop is the last hand box grown by this factor each side
+ROI_MARGIN = 0.6
+ROI_MIN_SIZE = 0.25  # fraction of the frame's shorter side
+# Adaptive resolution limits for the inference input
+MIN_INPUT_SCALE = 0.25
+# Size of the blank frame run through the model once to pay first-inference cost
+WARMUP_SHAPE = (240, 320, 3)
+
+# Landmark indices (mediapipe.solutions.hands.HandLandmark)
+WRIST = 0
+THUMB_TIP = 4
+FINGER_TIPS = (8, 12, 16, 20)  # index, middle, ring, pinky
+FINGER_MCPS = (5, 9, 13, 17)
+INDEX_FINGER_TIP = FINGER_TIPS[0]
+# The same rows as slices, which index a landmark array without copying
+TIPS = slice(FINGER_TIPS[0], FINGER_TIPS[-1] + 1, 4)
+MCPS = slice(FINGER_MCPS[0], FINGER_MCPS[-1] + 1, 4)
+# Same pairs as mediapipe.solutions.hands.HAND_CONNECTIONS
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+CONNECTION_INDEX = np.array(HAND_CONNECTIONS)
+
+PINCH_DISTANCE = 0.05  # thumb tip to index tip, normalized
+# Swipes are read from the One-Euro filtered wrist over a ring of recent
+# timestamped positions, so they don't depend on the tracking frame rate
+SWIPE_SECONDS = 0.2  # the newest position is compared with one at least this old
+SWIPE_MAX_SECONDS = 0.5  # an older reference means tracking stalled; wait for fresh ones
+SWIPE_DISTANCE = 0.1  # filtered wrist travel over SWIPE_SECONDS
+SWIPE_DOMINANCE = 1.5  # the main axis must beat the other one by this factor
+SWIPE_COOLDOWN = 0.27  # seconds after a turn before the next can register
+NOMINAL_FPS = 30.0  # frame spacing assumed when update() gets no timestamp
+
+
+# -------------------------------
+# One-Euro filter
+# -------------------------------
+class OneEuroFilter:
+    """One-Euro low-pass filter (Casiez et al., CHI 2012) over an (x, y)
+    point. The cutoff rises with speed: a resting hand is smoothed hard, a
+    swiping one is followed with little lag. Plain floats, since numpy
+    costs more than it saves on two values."""
+
+    def __init__(self, min_cutoff=1.0, beta=4.0, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.value = None
+        self.speed = None
+        self.t = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        return 1.0 / (1.0 + 1.0 / (2 * math.pi * cutoff * dt))
+
+    def __call__(self, x, y, t):
+        if self.value is None:
+            self.value, self.speed, self.t = (x, y), (0.0, 0.0), t
+            return x, y
+        dt = max(t - self.t, 1e-4)
+        self.t = t
+        (fx, fy), (sx, sy) = self.value, self.speed
+        a = self._alpha(self.d_cutoff, dt)
+        sx += a * ((x - fx) / dt - sx)
+        sy += a * ((y - fy) / dt - sy)
+        a = self._alpha(self.min_cutoff + self.beta * math.hypot(sx, sy), dt)
+        self.value = (fx + a * (x - fx), fy + a * (y - fy))
+        self.speed = (sx, sy)
+        return self.value
+
+
+# -------------------------------
+# Gesture Controller
+# -------------------------------
+class GestureController:
+    """Hand tracking plus gesture decoding.
+
+    ``roi`` crops each frame around the last hand box before inference and
+    falls back to the full frame when tracking is lost. ``budget_ms`` scales
+    the inference input down (or back up) to keep ``hands.process`` near
+    that many milliseconds.
+
+    Landmarks travel as (21, 3) arrays of normalized x, y, z. ``update``
+    smooths the wrist with a OneEuroFilter and only turns when the filtered
+    wrist has travelled SWIPE_DISTANCE within about SWIPE_SECONDS,
+    so single-frame jitter and detection glitches don't steer the snake.
+
+    The Hands model is imported, built and warmed up on a background thread;
+    until ``ready`` is set ``find_hand`` reports no hand. ``load_model=False``
+    skips it entirely for landmark replays, which only need ``update``.
+    """
+
+    def __init__(self, roi=False, budget_ms=None, timer=None, load_model=True):
+        self.hands = None
+        self.ready = threading.Event()
+        self.load_error = None
+        self.startup = {}  # mediapipe import / model build / first inference, ms
+        if load_model:
+            threading.Thread(target=self._load, name="mediapipe-load", daemon=True).start()
+
+        self.direction = "RIGHT"
+        self.wrist_filter = OneEuroFilter()
+        self.wrist_ring = deque()  # (t, x, y) of the filtered wrist, oldest first
+        self.last_t = 0.0
+        self.cooldown_until = 0.0  # no turn registers before this time
+        self.is_fist = False
+
+        self.roi = roi
+        self.roi_box = None  # (x0, y0, x1, y1) in pixels, None = full frame
+        self.budget_ms = budget_ms
+        self.input_scale = 1.0
+        self.infer_ms = 0.0  # moving average of hands.process time
+        self.timer = timer  # optional perf_stats.StageTimer
+
+    def _load(self):
+        try:
+            start = time.perf_counter()
+            import mediapipe as mp
+            imported = time.perf_counter()
+            hands = mp.solutions.hands.Hands(
+                static_image_mode=False,
+                max_num_hands=1,
+                min_detection_confidence=0.6,
+                min_tracking_confidence=0.6
+            )
+            built = time.perf_counter()
+            hands.process(np.zeros(WARMUP_SHAPE, dtype=np.uint8))
+            warmed = time.perf_counter()
+        except Exception as e:  # surfaced by wait_ready() / the game's report
+            self.load_error = e
+            print(f"❌ Hand tracking failed to load: {e}")
+            return
+        self.startup = {
+            "mediapipe import": (imported - start) * 1000,
+            "model build": (built - imported) * 1000,
+            "first inference": (warmed - built) * 1000,
+        }
+        self.hands = hands
+        self.ready.set()
+
+    def wait_ready(self, timeout=None):
+        """Block until the model is loaded; raises if loading failed"""
+        while not self.ready.wait(0.05 if timeout is None else timeout):
+            if self.load_error is not None:
+                raise RuntimeError("hand tracking failed to load") from self.load_error
+            if timeout is not None:
+                return False
+        return True
+
+    def reset(self):
+        """Forget per-game state so the controller can be reused"""
+        self.direction = "RIGHT"
+        self.wrist_filter.reset()
+        self.wrist_ring.clear()
+        self.cooldown_until = 0.0
+        self.is_fist = False
+        self.roi_box = None
+
+    def find_hand(self, frame):
+        """Run hand tracking on a BGR frame; returns the (21, 3) landmark
+        array (normalized to the full frame) or None. Always None while the
+        model is still loading."""
+        if not self.ready.is_set():
+            return None
+        start = time.perf_counter()
+        h, w = frame.shape[:2]
+        x0, y0, x1, y1 = self.roi_box if self.roi_box else (0, 0, w, h)
+        image = frame[y0:y1, x0:x1]
+        if self.input_scale < 1.0:
+            image = cv2.resize(image, None, fx=self.input_scale, fy=self.input_scale,
+                               interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+        processed = time.perf_counter()
+        result = self.hands.process(rgb)
+        end = time.perf_counter()
+        self._adapt_resolution((end - processed) * 1000)
+        if self.timer is not None:
+            self.timer.record("cvtColor", start, processed)
+            self.timer.record("hands.process", processed, end)
+
+        if not result.multi_hand_landmarks:
+            self.roi_box = None
+            return None
+        points = landmark_array(result.multi_hand_landmarks[0])
+        if self.roi_box:
+            # Map crop-relative coordinates back onto the full frame
+            cw, ch = x1 - x0, y1 - y0
+            points *= (cw / w, ch / h, cw / w)
+            points[:, :2] += (x0 / w, y0 / h)
+        if self.roi:
+            self.roi_box = self._hand_box(points, w, h)
+        return points
+
+    def _hand_box(self, points, w, h):
+        """Square crop around the hand, grown by ROI_MARGIN and clipped to the frame"""
+        (min_x, min_y), (max_x, max_y) = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+        min_x, max_x, min_y, max_y = min_x * w, max_x * w, min_y * h, max_y * h
+        cx, cy = (min_x + max_x) / 2, (min_y + max_y) / 2
+        side = max(max_x - min_x, max_y - min_y) * (1 + 2 * ROI_MARGIN)
+        side = max(side, ROI_MIN_SIZE * min(w, h))
+        half = side / 2
+        x0, x1 = max(int(cx - half), 0), min(int(cx + half), w)
+        y0, y1 = max(int(cy - half), 0), min(int(cy + half), h)
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return None
+        return (x0, y0, x1, y1)
+
+    def _adapt_resolution(self, elapsed_ms):
+        self.infer_ms = elapsed_ms if not self.infer_ms else 0.8 * self.infer_ms + 0.2 * elapsed_ms
+        if not self.budget_ms:
+            return
+        if self.infer_ms > self.budget_ms * 1.1:
+            self.input_scale = max(self.input_scale * 0.85, MIN_INPUT_SCALE)
+        elif self.infer_ms < self.budget_ms * 0.6:
+            self.input_scale = min(self.input_scale * 1.1, 1.0)
+
+    def update(self, points, timestamp=None):
+        """Turn one frame's (21, 3) landmarks (or None) into
+        (direction, is_pinching, is_fist). ``timestamp`` is the frame's
+        capture time in seconds; without one frames are NOMINAL_FPS apart."""
+        self.last_t = timestamp if timestamp is not None else self.last_t + 1.0 / NOMINAL_FPS
+        is_pinching = False
+        self.is_fist = False
+
+        if points is None:
+            self.wrist_filter.reset()
+            self.wrist_ring.clear()
+        else:
+            t = self.last_t
+            x, y = self.wrist_filter(*points[WRIST, :2].tolist(), t)
+            ring = self.wrist_ring
+            ring.append((t, x, y))
+            # Keep exactly one entry at least SWIPE_SECONDS old at the front
+            while len(ring) > 1 and t - ring[1][0] >= SWIPE_SECONDS:
+                ring.popleft()
+            ref_t, ref_x, ref_y = ring[0]
+            if SWIPE_SECONDS <= t - ref_t <= SWIPE_MAX_SECONDS and t >= self.cooldown_until:
+                dx, dy = x - ref_x, y - ref_y
+                ax, ay = abs(dx), abs(dy)
+                if max(ax, ay) > SWIPE_DISTANCE and max(ax, ay) > SWIPE_DOMINANCE * min(ax, ay):
+                    if ax > ay:
+                        self.direction = "RIGHT" if dx > 0 else "LEFT"
+                    else:
+                        self.direction = "DOWN" if dy > 0 else "UP"
+                    self.cooldown_until = t + SWIPE_COOLDOWN
+                    ring.clear()  # the same motion can't swipe twice
+
+            thumb_to_index = points[THUMB_TIP, :2] - points[INDEX_FINGER_TIP, :2]
+            is_pinching = bool(thumb_to_index @ thumb_to_index < PINCH_DISTANCE ** 2)
+            # Fist: every fingertip below its knuckle
+            self.is_fist = bool((points[TIPS, 1] > points[MCPS, 1]).all())
+
+        return self.direction, is_pinching, self.is_fist
+
+    def detect_gesture(self, frame, timestamp=None):
+        points = self.find_hand(frame)
+        if points is not None:
+            start = time.perf_counter()
+            draw_landmarks(frame, points)
+            if self.timer is not None:
+                self.timer.record("draw_landmarks", start)
+        direction, is_pinching, is_fist = self.update(points, timestamp)
+        return direction, is_pinching, frame, is_fist
+
+
+def landmark_array(hand):
+    """(21, 3) float32 array of normalized x, y, z for a hand's landmarks"""
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand.landmark], dtype=np.float32)
+
+
+def draw_landmarks(frame, points):
+    """Draw a landmark array the way mediapipe's drawing_utils does"""
+    h, w = frame.shape[:2]
+    pixels = (points[:, :2] * (w, h)).astype(np.int32)
+    # Every connection in one polylines call
+    cv2.polylines(frame, list(pixels[CONNECTION_INDEX]), False, (255, 0, 0), 2)
+    for p in pixels.tolist():
+        cv2.circle(frame, p, 3, (0, 255, 0), 2)
+    return frame
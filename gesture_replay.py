@@ -0,0 +1,94 @@
+"""Run the gesture pipeline headlessly on recorded input, as fast as possible.
+
+No camera, window or pygame is needed, so this works on a headless box::
+
+    python gesture_replay.py clip.mp4                        # video through MediaPipe
+    python gesture_replay.py clip.mp4 --save-landmarks clip.npz
+    python gesture_replay.py clip.npz                        # landmark replay only
+
+Prints throughput, per-stage timings and, when the NPZ carries expected
+``directions``, how often the decoded direction agreed with them.
+"""
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from capture import open_source, save_landmarks
+from gesture_controller import GestureController
+from perf_stats import StageTimer
+
+
+def replay(path, realtime=False, roi=False, budget_ms=None, landmarks_out=None, timer=None):
+    """Feed a video (or .npz landmark stream) through GestureController and
+    return a summary dict"""
+    is_npz = path.endswith(".npz")
+    source = open_source(video=None if is_npz else path, landmarks=path if is_npz else None,
+                         realtime=realtime, timer=timer)
+    if not source.is_opened():
+        raise IOError(f"Could not open {path}")
+    controller = GestureController(roi=roi, budget_ms=budget_ms, timer=timer, load_model=not is_npz)
+    if not is_npz:
+        controller.wait_ready()  # don't count model loading as dropped frames
+
+    directions, points, present = [], [], []
+    source.start()
+    start = time.perf_counter()
+    while not source.finished:
+        sample, _ = source.get_latest()
+        if sample is None:
+            if realtime:
+                time.sleep(0.001)
+            continue
+        if source.provides_landmarks:
+            hand = sample if len(sample) else None
+        else:
+            # Same orientation as the game, so saved landmarks replay 1:1
+            hand = controller.find_hand(cv2.flip(sample, 1))
+        direction, _, _ = controller.update(hand)
+        directions.append(direction)
+        if landmarks_out:
+            present.append(hand is not None)
+            points.append(hand if hand is not None else np.zeros((21, 3), np.float32))
+    elapsed = time.perf_counter() - start
+    source.release()
+
+    if landmarks_out:
+        save_landmarks(landmarks_out, points, present, fps=source.fps)
+
+    summary = {
+        "frames": len(directions),
+        "seconds": elapsed,
+        "fps": len(directions) / elapsed if elapsed else 0.0,
+        "directions": directions,
+    }
+    expected = getattr(source, "directions", None)
+    if expected is not None and len(expected) == len(directions):
+        summary["accuracy"] = float(np.mean([a == b for a, b in zip(directions, expected)]))
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless gesture pipeline replay")
+    parser.add_argument("path", help="video file or .npz landmark stream")
+    parser.add_argument("--save-landmarks", metavar="NPZ", default=None,
+                        help="extract the detected landmarks to an .npz file")
+    parser.add_argument("--realtime", action="store_true",
+                        help="pace input at the recording's frame rate")
+    parser.add_argument("--roi", action="store_true")
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    timer = StageTimer()
+    summary = replay(args.path, realtime=args.realtime, roi=args.roi, budget_ms=args.budget_ms,
+                     landmarks_out=args.save_landmarks, timer=timer)
+    print(f"{summary['frames']} frames in {summary['seconds']:.2f} s ({summary['fps']:.1f} fps)")
+    if "accuracy" in summary:
+        print(f"direction agreement: {summary['accuracy']:.1%}")
+    for line in timer.overlay_lines():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,27 @@
+import time
+_import_start = time.perf_counter()
+
+import argparse
 import cv2
-import mediapipe as mp
-import numpy as np
 import pygame
-import random
-import time
 import threading
 import os
+from itertools import islice
+
+import replay
+from autopilot import Autopilot
+from audio import load_sound, play_music
+from capture import open_source
+from game_loop import FixedStepClock
+from gesture_controller import GestureController, draw_landmarks
+from perf_stats import StageTimer
+from score_store import record_game
+from snake_engine import DIRECTION_INDEX, DIRECTIONS, SnakeEngine
+from text_cache import render_text
+
+# MediaPipe is not imported here: GestureController loads it in the
+# background, and gesture_worker is only imported when --worker is used.
+IMPORT_MS = (time.perf_counter() - _import_start) * 1000
 
 # -------------------------------
 # Initialize pygame mixer
@@ -14,106 +30,27 @@ pygame.mixer.init()
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+REPLAY_DIR = os.path.join(BASE_DIR, "replays")
 
 # -------------------------------
-# Load sounds
+# Load sounds (in the background; silent until ready)
 # -------------------------------
-def load_sound(name):
-    path = os.path.join(ASSETS_DIR, name)
-    if os.path.exists(path):
-        return pygame.mixer.Sound(path)
-    return None
-
 sound_eat = load_sound("eat_point.mp3")
 sound_over = load_sound("game_over.mp3")
 sound_tick = load_sound("countdown_beep.mp3")
-bg_music = os.path.join(ASSETS_DIR, "game_bg_music.mp3")
-
-# -------------------------------
-# Gesture Controller
-# -------------------------------
-class GestureController:
-    def __init__(self):
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.6,
-            min_tracking_confidence=0.6
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.direction = "RIGHT"
-        self.prev_pos = None
-        self.cooldown = 0
-        self.max_cooldown = 8
-        self.gesture_threshold = 0.05
-        self.is_fist = False
-
-    def detect_gesture(self, frame):
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = self.hands.process(rgb)
-        direction = None
-        is_pinching = False
-        self.is_fist = False
-
-        if result.multi_hand_landmarks:
-            for hand in result.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    frame, hand, self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=3),
-                    self.mp_drawing.DrawingSpec(color=(255, 0, 0), thickness=2)
-                )
-
-                # wrist movement
-                wrist = hand.landmark[self.mp_hands.HandLandmark.WRIST]
-                cur_pos = np.array([wrist.x, wrist.y])
-                if self.prev_pos is not None and self.cooldown <= 0:
-                    movement = cur_pos - self.prev_pos
-                    if np.linalg.norm(movement) > self.gesture_threshold:
-                        if abs(movement[0]) > abs(movement[1]):
-                            direction = "RIGHT" if movement[0] > 0 else "LEFT"
-                        else:
-                            direction = "DOWN" if movement[1] > 0 else "UP"
-                        self.direction = direction
-                        self.cooldown = self.max_cooldown
-                self.prev_pos = cur_pos
-
-                # Detect pinch
-                thumb_tip = hand.landmark[self.mp_hands.HandLandmark.THUMB_TIP]
-                index_tip = hand.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_TIP]
-                dist = np.linalg.norm(np.array([thumb_tip.x - index_tip.x, thumb_tip.y - index_tip.y]))
-                is_pinching = dist < 0.05
-
-                # Detect fist
-                tips = [
-                    self.mp_hands.HandLandmark.INDEX_FINGER_TIP,
-                    self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP,
-                    self.mp_hands.HandLandmark.RING_FINGER_TIP,
-                    self.mp_hands.HandLandmark.PINKY_TIP
-                ]
-                mcps = [
-                    self.mp_hands.HandLandmark.INDEX_FINGER_MCP,
-                    self.mp_hands.HandLandmark.MIDDLE_FINGER_MCP,
-                    self.mp_hands.HandLandmark.RING_FINGER_MCP,
-                    self.mp_hands.HandLandmark.PINKY_MCP
-                ]
-                folded = 0
-                for t, m in zip(tips, mcps):
-                    if hand.landmark[t].y > hand.landmark[m].y:
-                        folded += 1
-                if folded >= 4:
-                    self.is_fist = True
-
-        if self.cooldown > 0:
-            self.cooldown -= 1
-
-        return self.direction, is_pinching, frame, self.is_fist
-
 
 # -------------------------------
 # Snake Game Class
 # -------------------------------
 CELL_SIZE = 20
+TICK_RATE = 10   # simulation steps per second
+RENDER_FPS = 60  # frame cap; input is sampled once per frame
+
+# Webcam preview: "full" annotates the camera frame itself, "small" draws on
+# a downscaled copy, "off" skips annotation and the OpenCV window entirely
+PREVIEW_MODES = ("full", "small", "off")
+PREVIEW_SMALL_WIDTH = 320
+PREVIEW_WINDOW = "✋ Gesture Control (Webcam)"
 
 class SnakeGame:
     def __init__(self):
@@ -123,6 +60,7 @@ class SnakeGame:
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("🐍 Gesture Snake Game")
         self.clock = pygame.time.Clock()
+        self.ticker = FixedStepClock(TICK_RATE)
         self.running = True
 
         self.BLACK = (10, 10, 10)
@@ -130,137 +68,396 @@ class SnakeGame:
         self.RED = (255, 80, 80)
         self.WHITE = (255, 255, 255)
 
-        self.snake = [(200, 200), (180, 200), (160, 200)]
+        self.engine = SnakeEngine(self.width // CELL_SIZE, self.height // CELL_SIZE, start=(10, 10),
+                                  record=True)
         self.direction = "RIGHT"
-        self.score = 0
-        self.food = self.spawn_food()
         self.active = False
         self.countdown_done = False
+        self.countdown_text = ""
+        self.started = None  # perf_counter when the countdown finished
+        self.autopilot = None  # demo mode: steers instead of the hand (A key)
+        self.assisted = False  # the autopilot played part of this game
+        self.recorded_input = False  # hands come from a clip, not the live camera
+
+        play_music("game_bg_music.mp3", 0.4)
 
-        if os.path.exists(bg_music):
-            pygame.mixer.music.load(bg_music)
-            pygame.mixer.music.set_volume(0.4)
-            pygame.mixer.music.play(-1)
+    @property
+    def score(self):
+        return self.engine.score
 
-    def spawn_food(self):
-        x = random.randint(0, (self.width - CELL_SIZE) // CELL_SIZE) * CELL_SIZE
-        y = random.randint(0, (self.height - CELL_SIZE) // CELL_SIZE) * CELL_SIZE
-        return (x, y)
+    def to_pixels(self, cell):
+        col, row = self.engine.xy(cell)
+        return (col * CELL_SIZE, row * CELL_SIZE)
 
     def move(self, boost=False):
         if not self.active or not self.countdown_done:
             return
-        x, y = self.snake[0]
-        if self.direction == "UP": y -= CELL_SIZE
-        elif self.direction == "DOWN": y += CELL_SIZE
-        elif self.direction == "LEFT": x -= CELL_SIZE
-        elif self.direction == "RIGHT": x += CELL_SIZE
-
-        new_head = (x, y)
-        self.snake.insert(0, new_head)
-        if new_head == self.food:
-            self.score += 10
-            if sound_eat: sound_eat.play()
-            self.food = self.spawn_food()
-        else:
-            self.snake.pop()
-
-        if x < 0 or x >= self.width or y < 0 or y >= self.height or new_head in self.snake[1:]:
+        state, reward, done = self.engine.step(self.direction)
+        if reward: sound_eat.play()
+        if done:
             self.running = False
-            if sound_over: sound_over.play()
-
-    def draw(self, message=""):
+            sound_over.play()
+            try:
+                replay.save(self.engine, REPLAY_DIR, prefix="demo" if self.assisted else "gesture")
+            except OSError as e:  # a full or read-only disk never stops the game
+                print("Replay Error:", e)
+            if not (self.assisted or self.recorded_input):
+                record_game("gesture", self.engine, time.perf_counter() - self.started)
+
+    def draw_between(self, start, end, alpha):
+        """Draw a segment alpha of the way from cell start to cell end"""
+        (x0, y0), (x1, y1) = self.to_pixels(start), self.to_pixels(end)
+        x = x0 + (x1 - x0) * alpha
+        y = y0 + (y1 - y0) * alpha
+        pygame.draw.rect(self.screen, self.GREEN, (round(x), round(y), CELL_SIZE, CELL_SIZE))
+
+    def draw(self, message="", alpha=1.0, overlay=None):
+        """Render the board. ``alpha`` is how far into the next tick we are;
+        the head and tail are interpolated from their previous cells.
+        ``overlay`` lines (timing stats) are drawn in the top-right corner."""
         self.screen.fill(self.BLACK)
-        for x, y in self.snake:
-            pygame.draw.rect(self.screen, self.GREEN, (x, y, CELL_SIZE, CELL_SIZE))
-        pygame.draw.rect(self.screen, self.RED, (*self.food, CELL_SIZE, CELL_SIZE))
-        font = pygame.font.SysFont("Poppins", 26)
-        text = font.render(f"Score: {self.score}", True, self.WHITE)
+        body = self.engine.body
+        for cell in islice(body, 1, None):
+            pygame.draw.rect(self.screen, self.GREEN, (*self.to_pixels(cell), CELL_SIZE, CELL_SIZE))
+        if not self.active:
+            alpha = 1.0
+        self.draw_between(body[1], body[0], alpha)
+        tail = self.engine.state.tail
+        if tail is not None:
+            self.draw_between(tail, body[-1], alpha)
+        if self.engine.food is not None:
+            pygame.draw.rect(self.screen, self.RED, (*self.to_pixels(self.engine.food), CELL_SIZE, CELL_SIZE))
+        text = render_text(f"Score: {self.score}", 26, self.WHITE)
         self.screen.blit(text, (10, 10))
+        if overlay:
+            for i, line in enumerate(overlay):
+                self.screen.blit(render_text(line, 16, self.WHITE, name="Courier"), (self.width - 290, 10 + i * 16))
         if message:
-            msg_font = pygame.font.SysFont("Poppins", 34, bold=True)
-            msg_render = msg_font.render(message, True, (255, 255, 0))
+            msg_render = render_text(message, 34, (255, 255, 0), bold=True)
             rect = msg_render.get_rect(center=(self.width//2, self.height//2))
             self.screen.blit(msg_render, rect)
         pygame.display.flip()
 
+    def toggle_autopilot(self):
+        if self.autopilot is None:
+            self.autopilot = Autopilot(self.engine)
+            self.assisted = True
+        else:
+            self.autopilot = None
+
     def countdown(self):
-        font = pygame.font.SysFont("Poppins", 120, bold=True)
+        # Runs on its own thread; the game loop draws countdown_text
         for i in range(5, 0, -1):
-            self.draw(str(i))
-            if sound_tick: sound_tick.play()
-            pygame.display.flip()
+            self.countdown_text = str(i)
+            sound_tick.play()
             pygame.time.wait(1000)
+        self.countdown_text = ""
+        self.started = time.perf_counter()
         self.countdown_done = True
         self.active = True
 
     def quit(self):
         pygame.mixer.music.stop()
-        pygame.quit()
+        # Only close the window: mixer, fonts and cached text stay warm for
+        # the next game in this process
+        pygame.display.quit()
 
 
 # -------------------------------
 # Combined System
 # -------------------------------
-def run_gesture_game():
-    cap = cv2.VideoCapture(0)
-    if not cap.isOpened():
-        print("❌ Could not access webcam.")
+# Hand-tracking graphs survive between games in the same process
+_controllers = {}
+
+def get_controller(timer=None, **tracking):
+    """A GestureController for these options, reused (and reset) if one was
+    already built in this process"""
+    key = tuple(sorted(tracking.items()))
+    controller = _controllers.get(key)
+    if controller is None or controller.load_error is not None:
+        controller = _controllers[key] = GestureController(**tracking)
+    else:
+        controller.reset()
+    controller.timer = timer
+    return controller
+
+
+def run_gesture_game(use_worker=False, roi=False, budget_ms=None, trace_path=None,
+                     video=None, landmarks=None, fast=False, demo=False,
+                     preview="full", preview_every=1):
+    """Run the gesture game. With ``use_worker`` hand tracking runs in a child
+    process fed through shared memory instead of on the game thread; ``roi``
+    and ``budget_ms`` are passed on to GestureController. Per-stage timings
+    are shown with the S key and written to ``trace_path`` (.csv/.json).
+
+    ``video`` or ``landmarks`` replace the webcam with a recorded video or
+    NPZ landmark stream; ``fast`` feeds them without real-time pacing.
+    ``demo`` lets the autopilot play, starting without a fist; A toggles it.
+    ``preview`` is one of PREVIEW_MODES and is shown every ``preview_every``
+    tracked frames; with "off" keys are read from the game window."""
+    timer = StageTimer(keep_trace=trace_path is not None)
+    startup = {"imports": IMPORT_MS}
+    launched = time.perf_counter()
+
+    # Start the model loading first so it overlaps camera and window setup
+    tracking = {"roi": roi, "budget_ms": budget_ms}
+    replaying_landmarks = bool(landmarks)
+    use_worker = use_worker and not replaying_landmarks
+    controller = None
+    if not use_worker:
+        controller = get_controller(timer, load_model=not replaying_landmarks, **tracking)
+    else:
+        from gesture_worker import GestureWorker
+    worker = None  # created on the first frame, once its shape is known
+
+    start = time.perf_counter()
+    capture = open_source(video, landmarks, realtime=not fast, timer=timer)
+    if not capture.is_opened():
+        print("❌ Could not open the video source.")
         return
+    capture.start()
+    startup["camera"] = (time.perf_counter() - start) * 1000
 
-    controller = GestureController()
+    start = time.perf_counter()
     game = SnakeGame()
-
-    cv2.namedWindow("✋ Gesture Control (Webcam)")
-    cv2.moveWindow("✋ Gesture Control (Webcam)", 50, 150)
+    game.recorded_input = bool(video or landmarks or fast)
+    if demo:
+        game.toggle_autopilot()
+    startup["window"] = (time.perf_counter() - start) * 1000
+
+    show_window = preview != "off"
+    if show_window:
+        cv2.namedWindow(PREVIEW_WINDOW)
+        cv2.moveWindow(PREVIEW_WINDOW, 50, 150)
+    previews_offered = 0
+    preview_s = 0.0  # spent on preview and waitKey, for the exit report
+    frames = 0
 
     print("🖐 Game ready — show fist ✊ to start countdown.")
+    # Reported once hand tracking is usable (the worker's model loads unseen)
+    startup_reported = use_worker or replaying_landmarks
+    if startup_reported:
+        print_startup(startup)
 
     countdown_thread = None
+    gesture, pinch, is_fist = None, False, False
+    pending_turn = None  # (direction index, capture time) awaiting a tick
+    show_stats = False
+    overlay, overlay_at = None, 0.0
 
-    while game.running:
+    while game.running and not capture.finished:
         # ----- Camera Feed -----
-        ret, frame = cap.read()
-        if not ret:
-            continue
-        frame = cv2.flip(frame, 1)
-        gesture, pinch, annotated, is_fist = controller.detect_gesture(frame)
+        # Never blocks: without a new frame the game keeps the last gesture
+        frame_start = time.perf_counter()
+        frame, captured_at = capture.get_latest()
+        shown, shown_points = None, None  # tracked frame for the preview
+        previous_gesture = gesture
+        if capture.provides_landmarks:
+            # Replayed landmarks skip the camera and MediaPipe
+            if frame is not None:
+                hand = frame if len(frame) else None
+                gesture, pinch, is_fist = controller.update(hand, None if fast else captured_at)
+        elif use_worker:
+            if frame is not None:
+                if worker is None:
+                    worker = GestureWorker(frame.shape, **tracking)
+                target = worker.acquire()
+                if target is not None:
+                    slot, view = target
+                    start = time.perf_counter()
+                    cv2.flip(frame, 1, view)  # flip straight into shared memory
+                    timer.record("flip", start)
+                    # Unpaced replays filter at nominal spacing, as in-process
+                    worker.submit(slot, captured_at, None if fast else captured_at)
+            result = worker.poll() if worker else None
+            if result is not None:
+                timer.record("worker", result.captured_at)
+                gesture, pinch, is_fist = result.direction, result.is_pinching, result.is_fist
+                captured_at = result.captured_at
+                shown, shown_points = result.frame, result.landmarks
+        elif frame is not None:
+            start = time.perf_counter()
+            frame = cv2.flip(frame, 1)
+            timer.record("flip", start)
+            points = controller.find_hand(frame)
+            # Paced input has real capture times; --fast replays don't
+            gesture, pinch, is_fist = controller.update(points, None if fast else captured_at)
+            shown, shown_points = frame, points
+
+        if not startup_reported and controller.ready.is_set():
+            startup.update(controller.startup)
+            startup["ready after launch"] = (time.perf_counter() - launched) * 1000
+            print_startup(startup)
+            startup_reported = True
+
+        # A new direction starts the hand-moved -> snake-turned clock, but
+        # only for a turn the engine will take; it replaces any older one
+        if gesture and gesture != previous_gesture:
+            pending_turn = None
+            heading = game.engine.direction
+            turn = DIRECTION_INDEX[gesture]
+            if (game.active and game.countdown_done and game.autopilot is None
+                    and turn != heading and turn != (heading + 2) % 4):
+                pending_turn = (turn, captured_at)
 
         # Game trigger
-        if is_fist and not game.countdown_done:
+        if (is_fist or game.autopilot) and not game.countdown_done:
             if countdown_thread is None or not countdown_thread.is_alive():
-                print("✊ Fist detected — starting countdown!")
+                print("🤖 Demo — starting countdown!" if game.autopilot
+                      else "✊ Fist detected — starting countdown!")
                 countdown_thread = threading.Thread(target=game.countdown)
                 countdown_thread.start()
 
-        # Normal movement
+        # Normal movement: run the fixed steps that are due, then render
+        start = time.perf_counter()
         if gesture:
             game.direction = gesture
-        game.move(boost=pinch)
-        game.draw("" if game.countdown_done else "Show Fist ✊ to Start")
+        for _ in range(game.ticker.advance()):
+            if game.autopilot is not None and game.active:
+                game.direction = DIRECTIONS[game.autopilot.next_action()]
+            ticks = game.engine.ticks
+            game.move(boost=pinch)
+            if pending_turn and game.engine.ticks != ticks:
+                # The first tick after the gesture either takes the turn or
+                # ignores it; either way it is settled
+                if game.engine.direction == pending_turn[0]:
+                    timer.record("hand->turn", pending_turn[1])
+                pending_turn = None
+            if not game.running:
+                break
+        timer.record("game.move", start)
+
+        start = time.perf_counter()
+        if show_stats and start - overlay_at > 0.5:
+            overlay, overlay_at = timer.overlay_lines(), start
+        if game.countdown_text or game.countdown_done:
+            message = game.countdown_text
+        elif controller is not None and not controller.ready.is_set() and not replaying_landmarks:
+            # The load error itself is printed by the controller
+            message = ("Hand tracking failed to load" if controller.load_error is not None
+                       else "Loading hand tracking...")
+        else:
+            message = "Show Fist ✊ to Start"
+        game.draw(message, game.ticker.alpha, overlay if show_stats else None)
+        timer.record("game.draw", start)
 
         # Annotate webcam feed
-        cv2.putText(annotated, f"Gesture: {gesture}", (30, 50),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 0), 3)
-        if is_fist:
-            cv2.putText(annotated, "FIST DETECTED ✊", (30, 100),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 3)
-        cv2.imshow("✋ Gesture Control (Webcam)", annotated)
-
-        # Control FPS for smoothness
-        game.clock.tick(10)
-
-        key = cv2.waitKey(1) & 0xFF
+        if shown is not None and show_window:
+            previews_offered += 1
+            if previews_offered % preview_every == 0:
+                start = time.perf_counter()
+                show_preview(shown, shown_points, gesture, is_fist, preview == "small")
+                timer.record("preview", start)
+                preview_s += time.perf_counter() - start
+
+        # Cap the render rate; game speed is set by the fixed-step ticker
+        work_s = time.perf_counter() - frame_start
+        game.clock.tick(RENDER_FPS)
+
+        start = time.perf_counter()
+        if show_window:
+            key = cv2.waitKey(1) & 0xFF
+            timer.record("waitKey", start)
+            preview_s += time.perf_counter() - start
+        else:
+            key = read_game_key()
+        frames += 1
+        timer.add("frame", (work_s + time.perf_counter() - start) * 1000)
         if key in [27, ord('q')]:
             game.running = False
             break
+        if key == ord('s'):
+            show_stats = not show_stats
+            overlay_at = 0.0
+        if key == ord('a'):
+            game.toggle_autopilot()
+            pending_turn = None
 
     # Cleanup
     game.quit()
-    cap.release()
-    cv2.destroyAllWindows()
+    capture.release()
+    if worker is not None:
+        worker.close()
+    if show_window:
+        cv2.destroyAllWindows()
+    stats = capture.stats()
+    print(f"📷 Camera: {stats['captured']} frames, {stats['dropped']} dropped, "
+          f"frame age avg {stats['avg_age_ms']:.1f} ms / max {stats['max_age_ms']:.1f} ms")
+    for line in timer.overlay_lines():
+        print("   " + line)
+    frame_ms = timer.summary().get("frame", {}).get("p50", 0.0)
+    if show_window:
+        print(f"🖼 Preview {preview} every {preview_every}: "
+              f"{preview_s * 1000 / max(frames, 1):.2f} ms per frame on preview and waitKey "
+              f"(frame work p50 {frame_ms:.2f} ms); --preview off saves it")
+    else:
+        print(f"🖼 Preview off: frame work p50 {frame_ms:.2f} ms")
+    if trace_path:
+        timer.export(trace_path)
+        print(f"📝 Timing trace written to {trace_path}")
     print("👋 Game closed safely.")
 
+def show_preview(frame, points, gesture, is_fist, small=False):
+    """Annotate and show a tracked frame. ``small`` draws on a downscaled
+    copy and leaves ``frame`` untouched."""
+    scale = 1.0
+    if small:
+        scale = PREVIEW_SMALL_WIDTH / frame.shape[1]
+        frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    if points is not None:
+        draw_landmarks(frame, points)
+    thickness = max(int(3 * scale), 1)
+    cv2.putText(frame, f"Gesture: {gesture}", (int(30 * scale), int(50 * scale)),
+                cv2.FONT_HERSHEY_SIMPLEX, scale, (255, 255, 0), thickness)
+    if is_fist:
+        cv2.putText(frame, "FIST DETECTED ✊", (int(30 * scale), int(100 * scale)),
+                    cv2.FONT_HERSHEY_SIMPLEX, scale, (0, 255, 0), thickness)
+    cv2.imshow(PREVIEW_WINDOW, frame)
+
+def read_game_key():
+    """Last key pressed in the pygame window (waitKey-style code, 255 for
+    none); closing the window counts as Esc"""
+    key = 0xFF
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            key = 27
+        elif event.type == pygame.KEYDOWN and event.unicode:
+            key = ord(event.unicode) & 0xFF
+    return key
+
+def print_startup(startup):
+    print("🚀 Startup: " + ", ".join(f"{stage} {ms:.0f} ms" for stage, ms in startup.items()))
+
+def play(**options):
+    """Run gesture mode in this process (used by the home screen launcher)"""
+    run_gesture_game(**options)
+    return True
+
 
 if __name__ == "__main__":
-    run_gesture_game()
+    parser = argparse.ArgumentParser(description="Gesture-controlled Snake")
+    parser.add_argument("--worker", action="store_true",
+                        help="run hand tracking in a separate process")
+    parser.add_argument("--roi", action="store_true",
+                        help="track the hand in a cropped region of interest")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="adapt inference resolution to this time budget")
+    parser.add_argument("--trace", metavar="PATH", default=None,
+                        help="write per-stage timings to a .csv or .json file")
+    parser.add_argument("--video", metavar="PATH", default=None,
+                        help="read frames from a recorded video instead of the webcam")
+    parser.add_argument("--landmarks", metavar="PATH", default=None,
+                        help="replay a pre-extracted landmark stream (.npz)")
+    parser.add_argument("--demo", action="store_true",
+                        help="let the autopilot play (press A to take over)")
+    parser.add_argument("--fast", action="store_true",
+                        help="feed recorded input as fast as possible")
+    parser.add_argument("--preview", choices=PREVIEW_MODES, default="full",
+                        help="webcam preview: full size, a small copy, or none")
+    parser.add_argument("--preview-every", type=int, default=1, metavar="N",
+                        help="show only every Nth tracked frame")
+    args = parser.parse_args()
+    run_gesture_game(use_worker=args.worker, roi=args.roi, budget_ms=args.budget_ms,
+                     trace_path=args.trace, video=args.video, landmarks=args.landmarks,
+                     fast=args.fast, demo=args.demo, preview=args.preview,
+                     preview_every=max(args.preview_every, 1))
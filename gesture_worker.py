@@ -0,0 +1,100 @@
+"""Hand tracking in a child process, fed through a shared-memory frame ring.
+
+The game process writes camera frames straight into a slot of a
+``multiprocessing.shared_memory`` block (e.g. ``cv2.flip(frame, 1, dst=slot)``)
+and only the slot number crosses the process boundary. The worker runs
+``GestureController`` on that slot and sends back a compact result, so
+MediaPipe inference and the pygame loop run on separate cores.
+"""
+import multiprocessing
+import queue
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# ``frame`` is a view of the shared slot the result was computed on; it stays
+# valid until that slot comes round the ring again.
+GestureResult = namedtuple(
+    "GestureResult", "frame captured_at direction is_pinching is_fist landmarks"
+)
+
+
+def _worker_main(shm_name, shape, slots, jobs, results, options):
+    # Imported here so only the child loads MediaPipe
+    from gesture_controller import GestureController
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((slots,) + shape, dtype=np.uint8, buffer=shm.buf)
+    controller = GestureController(**options)
+    try:
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            slot, captured_at, timestamp = job
+            points = controller.find_hand(frames[slot])
+            direction, is_pinching, is_fist = controller.update(points, timestamp)
+            results.put((slot, captured_at, direction, is_pinching, is_fist, points))
+    finally:
+        del frames
+        shm.close()
+
+
+class GestureWorker:
+    """Runs hand tracking in a separate process with at most one frame in flight"""
+
+    def __init__(self, frame_shape, slots=3, **controller_options):
+        self.shape = tuple(frame_shape)
+        self.slots = slots
+        size = int(np.prod(self.shape)) * slots
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.shm.buf)
+
+        ctx = multiprocessing.get_context("spawn")
+        self.jobs = ctx.Queue()
+        self.results = ctx.Queue()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(self.shm.name, self.shape, slots, self.jobs, self.results, controller_options),
+            daemon=True,
+        )
+        self.process.start()
+
+        self.next_slot = 0
+        self.busy = False
+        self.frames_skipped = 0  # offered while the worker was still busy
+
+    def acquire(self):
+        """Return ``(slot, view)`` to write the next frame into, or None if the
+        worker is busy and the frame should be dropped."""
+        if self.busy:
+            self.frames_skipped += 1
+            return None
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % self.slots
+        return slot, self.frames[slot]
+
+    def submit(self, slot, captured_at, timestamp=None):
+        """Queue ``slot`` for tracking; ``timestamp`` is passed on to
+        GestureController.update (None = nominal frame spacing)"""
+        self.jobs.put((slot, captured_at, timestamp))
+        self.busy = True
+
+    def poll(self):
+        """Latest GestureResult if the worker has finished a frame, else None"""
+        try:
+            slot, captured_at, direction, pinch, fist, points = self.results.get_nowait()
+        except queue.Empty:
+            return None
+        self.busy = False
+        return GestureResult(self.frames[slot], captured_at, direction, pinch, fist, points)
+
+    def close(self):
+        self.jobs.put(None)
+        self.process.join(timeout=2.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        del self.frames
+        self.shm.close()
+        self.shm.unlink()
@@ -0,0 +1,252 @@
+"""Huge-board stress mode: a grid far bigger than the window, seen through a
+scrolling viewport.
+
+Boards go up to 10,000 x 10,000 cells; the engine tracks occupancy in a
+BitGrid there (one bit per cell). The snake is laid along a serpentine
+Hamiltonian cycle and keeps following it, so it can be hundreds of
+thousands of segments long and never dies. Only the chunks under the camera
+are drawn. Each CHUNK x CHUNK block is painted once into a cached surface,
+and after that a tick only repaints the cells it changed::
+
+    python huge_board.py --cols 10000 --rows 10000 --length 200000
+    python huge_board.py --frames 600        # stop after 600 frames and print stats
+"""
+import argparse
+import time
+from collections import OrderedDict, deque
+
+import pygame
+
+from game_loop import FixedStepClock
+from snake_engine import SnakeEngine
+from text_cache import render_text
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+CELL_SIZE = 6
+CHUNK = 32  # cells per side of a cached chunk surface
+MAX_CHUNKS = 96  # chunk surfaces kept; about 4x what one screen shows
+FOLLOW_MARGIN = 0.3  # keep the head this fraction of the view away from its edges
+RENDER_FPS = 60
+
+BLACK = (10, 15, 21)
+GREEN = (102, 255, 204)
+LIGHT_GREEN = (0, 255, 170)
+RED = (255, 80, 80)
+WHITE = (255, 255, 255)
+WALL = (255, 204, 0)
+
+
+# -------------------------------
+# Serpentine snake
+# -------------------------------
+def serpentine_next(cell, cols, rows):
+    """The next cell on autopilot.hamiltonian_cycle's serpentine (even
+    ``rows``), computed instead of looked up so huge boards need no table"""
+    row, col = divmod(cell, cols)
+    if col == 0:
+        return cell - cols if row > 0 else cell + 1
+    if row % 2 == 0:
+        return cell + 1 if col < cols - 1 else cell + cols
+    if col > 1:
+        return cell - 1
+    return cell + cols if row < rows - 1 else cell - 1
+
+
+def lay_snake(engine, length):
+    """Replace the engine's snake with one of ``length`` cells along the
+    serpentine and return a function giving the action that keeps it there"""
+    cols, rows = engine.cols, engine.rows
+    if rows % 2 or length >= cols * rows:
+        raise ValueError("needs an even number of rows and length < cols * rows")
+    for cell in engine.body:
+        engine.free_cells.release(cell)
+    cells = [1]
+    for _ in range(length - 1):
+        cells.append(serpentine_next(cells[-1], cols, rows))
+    engine.body = deque(reversed(cells))  # head first
+    for cell in cells:
+        engine.free_cells.occupy(cell)
+    engine.head_x, engine.head_y = engine.xy(engine.body[0])
+    engine.food = engine.free_cells.sample(engine.rng)
+
+    direction_of = {-cols: 0, 1: 1, cols: 2, -1: 3}
+    if length > 1:
+        engine.direction = direction_of[cells[-1] - cells[-2]]
+
+    def next_action():
+        head = engine.body[0]
+        return direction_of[serpentine_next(head, cols, rows) - head]
+    return next_action
+
+
+# -------------------------------
+# Chunked viewport renderer
+# -------------------------------
+class ChunkRenderer:
+    """Draws the part of the board under a camera that follows the head.
+
+    Chunk surfaces are built on first sight from the engine's occupancy and
+    kept in an LRU of ``max_chunks``; ``cell_changed`` patches a cached
+    chunk in place so ticks never rebuild one."""
+
+    def __init__(self, engine, width=SCREEN_WIDTH, height=SCREEN_HEIGHT,
+                 cell_size=CELL_SIZE, chunk=CHUNK, max_chunks=MAX_CHUNKS):
+        self.engine = engine
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.chunk = chunk
+        self.chunk_px = chunk * cell_size
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()  # (chunk col, chunk row) -> Surface
+        self.world_w = engine.cols * cell_size
+        self.world_h = engine.rows * cell_size
+        self.camera_x = 0  # top-left of the view in world pixels
+        self.camera_y = 0
+        self.chunks_built = 0
+        self.center_on(engine.body[0])
+
+    def center_on(self, cell):
+        col, row = self.engine.xy(cell)
+        self.camera_x = col * self.cell_size - self.width // 2
+        self.camera_y = row * self.cell_size - self.height // 2
+        self._clamp()
+
+    def follow(self, cell):
+        """Scroll just enough to keep ``cell`` inside the follow margin"""
+        col, row = self.engine.xy(cell)
+        x, y = col * self.cell_size - self.camera_x, row * self.cell_size - self.camera_y
+        margin_x, margin_y = int(self.width * FOLLOW_MARGIN), int(self.height * FOLLOW_MARGIN)
+        if x < margin_x:
+            self.camera_x -= margin_x - x
+        elif x > self.width - margin_x:
+            self.camera_x += x - (self.width - margin_x)
+        if y < margin_y:
+            self.camera_y -= margin_y - y
+        elif y > self.height - margin_y:
+            self.camera_y += y - (self.height - margin_y)
+        self._clamp()
+
+    def _clamp(self):
+        self.camera_x = max(min(self.camera_x, self.world_w - self.width), 0)
+        self.camera_y = max(min(self.camera_y, self.world_h - self.height), 0)
+
+    def _build(self, key):
+        chunk, size = self.chunk, self.cell_size
+        surface = pygame.Surface((self.chunk_px, self.chunk_px))
+        surface.fill(BLACK)
+        cols, rows = self.engine.cols, self.engine.rows
+        is_free = self.engine.free_cells.is_free
+        col0, row0 = key[0] * chunk, key[1] * chunk
+        for row in range(row0, min(row0 + chunk, rows)):
+            y = (row - row0) * size
+            cell = row * cols + col0
+            for x in range(0, min(chunk, cols - col0) * size, size):
+                if not is_free(cell):
+                    surface.fill(GREEN, (x, y, size - 1, size - 1))
+                cell += 1
+        self.chunks_built += 1
+        return surface
+
+    def cell_changed(self, cell):
+        col, row = self.engine.xy(cell)
+        surface = self.chunks.get((col // self.chunk, row // self.chunk))
+        if surface is None:
+            return  # built fresh when it comes into view
+        size = self.cell_size
+        rect = ((col % self.chunk) * size, (row % self.chunk) * size, size - 1, size - 1)
+        surface.fill(BLACK if self.engine.free_cells.is_free(cell) else GREEN, rect)
+
+    def draw(self, screen):
+        chunks = self.chunks
+        first_x, first_y = self.camera_x // self.chunk_px, self.camera_y // self.chunk_px
+        last_x = (self.camera_x + self.width - 1) // self.chunk_px
+        last_y = (self.camera_y + self.height - 1) // self.chunk_px
+        for cy in range(first_y, last_y + 1):
+            for cx in range(first_x, last_x + 1):
+                key = (cx, cy)
+                surface = chunks.get(key)
+                if surface is None:
+                    surface = chunks[key] = self._build(key)
+                    if len(chunks) > self.max_chunks:
+                        chunks.popitem(last=False)
+                else:
+                    chunks.move_to_end(key)
+                screen.blit(surface, (cx * self.chunk_px - self.camera_x,
+                                      cy * self.chunk_px - self.camera_y))
+
+        # Head, food and walls change every frame, so they are not cached
+        self._draw_cell(screen, self.engine.body[0], LIGHT_GREEN)
+        if self.engine.food is not None:
+            self._draw_cell(screen, self.engine.food, RED)
+        pygame.draw.rect(screen, WALL, (-self.camera_x, -self.camera_y,
+                                        self.world_w, self.world_h), 1)
+
+    def _draw_cell(self, screen, cell, color):
+        col, row = self.engine.xy(cell)
+        x, y = col * self.cell_size - self.camera_x, row * self.cell_size - self.camera_y
+        if -self.cell_size < x < self.width and -self.cell_size < y < self.height:
+            screen.fill(color, (x, y, self.cell_size - 1, self.cell_size - 1))
+
+
+# -------------------------------
+# Stress run
+# -------------------------------
+def run(cols, rows, length, tick_rate, frames=None, seed=0):
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("🐍 Snake - Huge Board")
+
+    start = time.perf_counter()
+    engine = SnakeEngine(cols, rows, seed=seed)
+    next_action = lay_snake(engine, length)
+    setup_s = time.perf_counter() - start
+    renderer = ChunkRenderer(engine)
+    ticker = FixedStepClock(tick_rate, max_steps=max(tick_rate // 10, 10))
+    clock = pygame.time.Clock()
+    print(f"🗺 {cols:,} x {rows:,} board, snake of {length:,} laid in {setup_s:.2f} s; "
+          f"occupancy {type(engine.free_cells).__name__}")
+
+    running = True
+    start = time.perf_counter()
+    while running and not engine.done and (frames is None or ticker.frames < frames):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN
+                                             and event.key == pygame.K_ESCAPE):
+                running = False
+
+        for _ in range(ticker.advance()):
+            state, _, done = engine.step(next_action())
+            renderer.cell_changed(state.head)
+            if state.tail is not None:
+                renderer.cell_changed(state.tail)
+            if done:
+                break
+
+        renderer.follow(engine.body[0])
+        screen.fill(BLACK)
+        renderer.draw(screen)
+        hud = (f"length {len(engine.body):,}  ticks {engine.ticks:,}  "
+               f"fps {clock.get_fps():.0f}  chunks {len(renderer.chunks)}")
+        screen.blit(render_text(hud, 20, WHITE), (10, 10))
+        pygame.display.flip()
+        clock.tick(RENDER_FPS if frames is None else 0)
+
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+    print(f"📊 {ticker.frames} frames in {elapsed:.2f} s ({ticker.frames / elapsed:.0f} fps), "
+          f"{engine.ticks:,} ticks, {renderer.chunks_built} chunk builds")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snake on a huge scrolling board")
+    parser.add_argument("--cols", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--length", type=int, default=200000)
+    parser.add_argument("--tps", type=int, default=60, help="simulation ticks per second")
+    parser.add_argument("--frames", type=int, default=None,
+                        help="stop after this many frames (uncapped frame rate)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.cols, args.rows, args.length, args.tps, args.frames, args.seed)
@@ -1,11 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk, ImageSequence
 import threading
+import importlib
 import pygame
 import os
-import subprocess
-import sys
+import time
+
+from frame_cache import AnimationFrames
+from score_store import ScoreStore
 
 # ----------------------------
 # Initialize pygame mixer
@@ -16,6 +18,8 @@ pygame.mixer.init()
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 
+SCORES_PER_PAGE = 15
+
 # ----------------------------
 # Music Control
 # ----------------------------
@@ -84,28 +88,20 @@ class SnakeGameHome(tk.Tk):
             self.bg_label.config(bg="#1a1a1a")
             return
 
-        frames = []
-        for img in ImageSequence.Iterator(Image.open(gif_path)):
-            img_ratio = img.width / img.height
-            target_ratio = 800 / 600
-            if img_ratio > target_ratio:
-                new_height = 600
-                new_width = int(new_height * img_ratio)
-            else:
-                new_width = 800
-                new_height = int(new_width / img_ratio)
-            resized = img.resize((new_width, new_height), Image.LANCZOS)
-            # Crop center
-            left = (resized.width - 800) // 2
-            top = (resized.height - 600) // 2
-            cropped = resized.crop((left, top, left + 800, top + 600))
-            frames.append(ImageTk.PhotoImage(cropped))
-        self.frames = frames
+        # Frames come from the disk cache, or stream in from a decode thread
+        # on the first run, so the window never waits for the whole GIF
+        self.frames = AnimationFrames(gif_path, (800, 600))
 
         def update_frame(index=0):
-            frame = self.frames[index]
-            self.bg_label.configure(image=frame)
-            index = (index + 1) % len(self.frames)
+            frame = self.frames.photo(index)
+            if frame is not None:
+                self.bg_label.configure(image=frame)
+                index += 1
+            elif self.frames.done and not self.frames.count:
+                self.bg_label.config(bg="#1a1a1a")
+                return
+            if self.frames.done and index >= self.frames.count:
+                index = 0
             self.after(60, update_frame, index)
 
         update_frame()
@@ -138,28 +134,33 @@ class SnakeGameHome(tk.Tk):
     # Button Actions
     # ----------------------------
     def play_manual(self):
-        stop_music()
-        self.destroy()
         print("🎮 Launching Manual Mode...")
-        subprocess.run([sys.executable, os.path.join(BASE_DIR, "manual_snake_game.py")])
-        os.execl(sys.executable, sys.executable, *sys.argv)  # Relaunch main menu
+        self.launch("manual_snake_game")
 
     def play_gesture(self):
-        stop_music()
-        self.destroy()
         print("✋ Launching Gesture Mode...")
-        subprocess.run([sys.executable, os.path.join(BASE_DIR, "gesture_snake_game.py")])
-        os.execl(sys.executable, sys.executable, *sys.argv)
+        self.launch("gesture_snake_game")
 
-    def show_scoreboard(self):
-        score_file = os.path.join(BASE_DIR, "scores.txt")
-        if not os.path.exists(score_file):
-            messagebox.showinfo("Scoreboard", "No scores recorded yet.")
-            return
+    def launch(self, module_name):
+        """Run a game mode inside this process while the menu is hidden.
 
-        with open(score_file, "r") as f:
-            scores = f.read().strip()
-        messagebox.showinfo("🏆 Scoreboard", scores or "No scores available.")
+        The game module is imported once and stays loaded, so pygame, OpenCV,
+        MediaPipe, sounds and this window's animation frames are all still
+        warm for the next round trip."""
+        stop_music()
+        self.withdraw()
+        start = time.perf_counter()
+        try:
+            game = importlib.import_module(module_name)
+            print(f"⏱ Mode ready in {(time.perf_counter() - start) * 1000:.0f} ms")
+            game.play()
+        finally:
+            self.deiconify()
+            self.lift()
+            threading.Thread(target=play_music, daemon=True).start()
+
+    def show_scoreboard(self):
+        ScoreboardWindow(self)
 
     def show_about(self):
         about_text = (
@@ -180,9 +181,92 @@ class SnakeGameHome(tk.Tk):
         self.destroy()
 
 
+# ----------------------------
+# Scoreboard
+# ----------------------------
+class ScoreboardWindow(tk.Toplevel):
+    """Top scores one page at a time, filterable by mode"""
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("🏆 Scoreboard")
+        self.geometry("560x440")
+        self.configure(bg="#0b132b")
+        self.transient(master)
+        self.store = ScoreStore()
+        self.pages = [None]  # keyset cursor (last Score of the previous page) per page
+        self.rows = []
+
+        top = tk.Frame(self, bg="#0b132b")
+        top.pack(fill="x", padx=10, pady=8)
+        tk.Label(top, text="Mode:", fg="#66ffcc", bg="#0b132b",
+                 font=("Poppins", 12, "bold")).pack(side="left")
+        self.mode = tk.StringVar(value="All")
+        modes = ttk.Combobox(top, textvariable=self.mode, state="readonly", width=12,
+                             values=["All"] + self.store.modes())
+        modes.pack(side="left", padx=6)
+        modes.bind("<<ComboboxSelected>>", lambda e: self.reload())
+
+        columns = ("rank", "mode", "score", "length", "duration", "date")
+        self.table = ttk.Treeview(self, columns=columns, show="headings", height=SCORES_PER_PAGE)
+        for name, width in zip(columns, (50, 80, 70, 70, 80, 150)):
+            self.table.heading(name, text=name.title())
+            self.table.column(name, width=width, anchor="center")
+        self.table.pack(fill="both", expand=True, padx=10)
+
+        nav = tk.Frame(self, bg="#0b132b")
+        nav.pack(fill="x", padx=10, pady=8)
+        self.prev_btn = tk.Button(nav, text="◀ Prev", command=self.prev_page)
+        self.next_btn = tk.Button(nav, text="Next ▶", command=self.next_page)
+        self.page_label = tk.Label(nav, fg="#66ffcc", bg="#0b132b")
+        self.prev_btn.pack(side="left")
+        self.next_btn.pack(side="right")
+        self.page_label.pack()
+
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.reload()
+
+    def reload(self):
+        self.pages = [None]
+        self.show_page()
+
+    def show_page(self):
+        mode = None if self.mode.get() == "All" else self.mode.get()
+        # One extra row tells whether there is a next page
+        rows = self.store.top(SCORES_PER_PAGE + 1, mode=mode, after=self.pages[-1])
+        self.rows = rows[:SCORES_PER_PAGE]
+        self.table.delete(*self.table.get_children())
+        first_rank = (len(self.pages) - 1) * SCORES_PER_PAGE + 1
+        for rank, row in enumerate(self.rows, first_rank):
+            played = time.strftime("%Y-%m-%d %H:%M", time.localtime(row.played_at))
+            self.table.insert("", "end", values=(rank, row.mode, row.score, row.length,
+                                                 f"{row.duration:.0f} s", played))
+        if not self.rows and len(self.pages) == 1:
+            self.table.insert("", "end", values=("", "", "No scores recorded yet.", "", "", ""))
+        self.page_label.config(text=f"Page {len(self.pages)}")
+        self.prev_btn.config(state="normal" if len(self.pages) > 1 else "disabled")
+        self.next_btn.config(state="normal" if len(rows) > SCORES_PER_PAGE else "disabled")
+
+    def next_page(self):
+        self.pages.append(self.rows[-1])
+        self.show_page()
+
+    def prev_page(self):
+        self.pages.pop()
+        self.show_page()
+
+    def close(self):
+        self.store.close()
+        self.destroy()
+
+
 # ----------------------------
 # Run the App
 # ----------------------------
-if __name__ == "__main__":
+def main():
     app = SnakeGameHome()
     app.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
+import argparse
 import pygame
-import random
 import os
-import subprocess
-import sys
+import time
+from collections import deque
+
+import replay
+from audio import load_sound, play_music
+from autopilot import Autopilot
+from game_loop import FixedStepClock
+from perf_stats import StageTimer
+from score_store import record_game
+from snake_engine import DIRECTION_INDEX, DIRECTIONS, SnakeEngine
 
 # Initialize pygame
 pygame.init()
@@ -11,13 +19,25 @@ pygame.mixer.init()
 # Paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+REPLAY_DIR = os.path.join(BASE_DIR, "replays")
 
 # Screen setup
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 CELL_SIZE = 20
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("🐍 Snake Game - Manual Mode")
+GRID_COLS = SCREEN_WIDTH // CELL_SIZE
+GRID_ROWS = SCREEN_HEIGHT // CELL_SIZE
+RENDER_FPS = 60  # frame cap; the game speed is set by SnakeGame.speed
+
+# Arrow-key presses wait in a queue and each tick applies one, so quick
+# double turns survive; presses beyond this many are dropped
+INPUT_QUEUE_SIZE = 3
+ARROW_KEYS = {pygame.K_UP: "UP", pygame.K_RIGHT: "RIGHT", pygame.K_DOWN: "DOWN", pygame.K_LEFT: "LEFT"}
+
+# The window is opened by open_window(), not at import, so the launcher can
+# keep this module (fonts, sounds) loaded between games
+screen = None
+background = None
 
 # Colors
 BLACK = (10, 15, 21)
@@ -28,137 +48,193 @@ RED = (255, 80, 80)
 WHITE = (255, 255, 255)
 GRID_COLOR = (25, 35, 45)
 
+# Grid baked once into a background surface; frames restore cells from it
+# instead of refilling the screen and redrawing every line
+def render_background():
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    surface.fill(BLACK)
+    for x in range(0, SCREEN_WIDTH, CELL_SIZE):
+        pygame.draw.line(surface, GRID_COLOR, (x, 0), (x, SCREEN_HEIGHT))
+    for y in range(0, SCREEN_HEIGHT, CELL_SIZE):
+        pygame.draw.line(surface, GRID_COLOR, (0, y), (SCREEN_WIDTH, y))
+    return surface
+
+def open_window():
+    global screen, background
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("🐍 Snake Game - Manual Mode")
+    background = render_background()
+
 # Fonts
 font = pygame.font.SysFont("Poppins", 28, bold=True)
 small_font = pygame.font.SysFont("Poppins", 22)
 big_font = pygame.font.SysFont("Poppins", 60, bold=True)
 
-# Load Sounds
-def load_sound(file):
-    path = os.path.join(ASSETS_DIR, file)
-    if os.path.exists(path):
-        return pygame.mixer.Sound(path)
-    return None
-
+# Load Sounds (in the background; silent until ready)
 sound_start = load_sound("game_start.mp3")
 sound_eat = load_sound("eat_point.mp3")
 sound_over = load_sound("game_over.mp3")
 
-bg_music_path = os.path.join(ASSETS_DIR, "game_bg_music.mp3")
-
 # Snake Game Class
 class SnakeGame:
-    def __init__(self):
+    def __init__(self, demo=False, timer=None, input_stats=None):
         self.clock = pygame.time.Clock()
         self.running = True
+        self.return_home = False
         self.game_over = False
-        self.speed = 8
+        self.speed = 8  # simulation ticks per second
+        self.ticker = FixedStepClock(self.speed)
 
-        # Snake setup
-        self.snake = [(100, 50), (90, 50), (80, 50)]
+        # Game rules live in the headless engine; this class only renders
+        self.engine = SnakeEngine(GRID_COLS, GRID_ROWS, start=(5, 2), record=True)
         self.direction = "RIGHT"
-
-        # Food setup
-        self.food = self.spawn_food()
-        self.score = 0
+        self.turns = deque()  # (direction, time pressed) not yet applied
+        # "key->turn": keypress to the tick that applies it. The timer and
+        # the turn counts are kept across restarts and reported on exit.
+        self.timer = timer or StageTimer()
+        self.input_stats = input_stats or {"turns": 0, "dropped": 0}
+        self.started = time.perf_counter()
+        # Demo mode: the autopilot steers (toggle with A). Games it touched
+        # don't go on the scoreboard.
+        self.autopilot = Autopilot(self.engine) if demo else None
+        self.assisted = demo
+
+        # Rendering state: the first frame is drawn in full, later ones only
+        # repaint the cells and score area that changed
+        self.full_redraw = True
+        self.game_over_shown = False
+        self.score_rect = None
+        self.drawn_score = None
+        self.dirty_cells = set()  # cells changed by ticks since the last frame
 
         # Play start sound
-        if sound_start:
-            sound_start.play()
-        
+        sound_start.play()
+
         # Background Music
-        if os.path.exists(bg_music_path):
-            pygame.mixer.music.load(bg_music_path)
-            pygame.mixer.music.set_volume(0.5)
-            pygame.mixer.music.play(-1)
+        play_music("game_bg_music.mp3", 0.5)
 
-    def spawn_food(self):
-        return (
-            random.randrange(0, (SCREEN_WIDTH // CELL_SIZE)) * CELL_SIZE,
-            random.randrange(0, (SCREEN_HEIGHT // CELL_SIZE)) * CELL_SIZE
-        )
+    @property
+    def score(self):
+        return self.engine.score
 
-    def move(self):
-        x, y = self.snake[0]
-
-        # move in grid steps
-        if self.direction == "UP":
-            y -= CELL_SIZE
-        elif self.direction == "DOWN":
-            y += CELL_SIZE
-        elif self.direction == "LEFT":
-            x -= CELL_SIZE
-        elif self.direction == "RIGHT":
-            x += CELL_SIZE
-
-    # round to nearest cell to prevent float mismatches
-        x = (x // CELL_SIZE) * CELL_SIZE
-        y = (y // CELL_SIZE) * CELL_SIZE
-
-        new_head = (x, y)
-        self.snake.insert(0, new_head)
-
-    # Ensure food and snake positions are aligned to grid
-        fx, fy = self.food
-        fx = (fx // CELL_SIZE) * CELL_SIZE
-        fy = (fy // CELL_SIZE) * CELL_SIZE
-
-    # Correct food-eating detection
-        if abs(new_head[0] - fx) < CELL_SIZE and abs(new_head[1] - fy) < CELL_SIZE:
-            self.score += 10
-            if sound_eat:
-                sound_eat.play()
-            self.food = self.spawn_food()
-        else:
-            self.snake.pop()
+    @property
+    def food(self):
+        """Pixel position of the food, or None on a full board"""
+        if self.engine.food is None:
+            return None
+        return self.to_pixels(self.engine.food)
 
+    def to_pixels(self, cell):
+        col, row = self.engine.xy(cell)
+        return (col * CELL_SIZE, row * CELL_SIZE)
 
-    def check_collision(self):
-        head_x, head_y = self.snake[0]
-        # Wall collision
-        if (
-            head_x < 0 or head_x >= SCREEN_WIDTH or
-            head_y < 0 or head_y >= SCREEN_HEIGHT
-        ):
+    def move(self):
+        self.dirty_cells.add(self.engine.body[0])  # old head, now drawn as body
+        state, reward, done = self.engine.step(self.direction)
+        self.dirty_cells.add(state.head)
+        if state.tail is not None:
+            self.dirty_cells.add(state.tail)
+        if state.food is not None:
+            self.dirty_cells.add(state.food)
+        if reward:
+            sound_eat.play()
+        if done:
             self.game_over = True
-        # Self collision
-        for block in self.snake[1:]:
-            if (head_x, head_y) == block:
-                self.game_over = True
+            try:
+                replay.save(self.engine, REPLAY_DIR, prefix="demo" if self.assisted else "manual")
+            except OSError as e:  # a full or read-only disk never stops the game
+                print("Replay Error:", e)
+            if not self.assisted:
+                record_game("manual", self.engine, time.perf_counter() - self.started)
 
     def draw_snake(self):
-        for i, pos in enumerate(self.snake):
+        for i, cell in enumerate(self.engine.body):
+            pos = self.to_pixels(cell)
             color = LIGHT_GREEN if i == 0 else GREEN
             pygame.draw.rect(screen, color, pygame.Rect(pos[0], pos[1], CELL_SIZE - 1, CELL_SIZE - 1))
 
     def draw_food(self):
+        if self.food is None:
+            return
         pygame.draw.rect(screen, YELLOW, pygame.Rect(self.food[0], self.food[1], CELL_SIZE, CELL_SIZE))
 
-    def draw_grid(self):
-        for x in range(0, SCREEN_WIDTH, CELL_SIZE):
-            pygame.draw.line(screen, GRID_COLOR, (x, 0), (x, SCREEN_HEIGHT))
-        for y in range(0, SCREEN_HEIGHT, CELL_SIZE):
-            pygame.draw.line(screen, GRID_COLOR, (0, y), (SCREEN_WIDTH, y))
-
-    def handle_input(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_UP] and self.direction != "DOWN":
-            self.direction = "UP"
-        elif keys[pygame.K_DOWN] and self.direction != "UP":
-            self.direction = "DOWN"
-        elif keys[pygame.K_LEFT] and self.direction != "RIGHT":
-            self.direction = "LEFT"
-        elif keys[pygame.K_RIGHT] and self.direction != "LEFT":
-            self.direction = "RIGHT"
-
-    def draw_ui(self):
-        score_text = font.render(f"Score: {self.score}", True, WHITE)
-        screen.blit(score_text, (10, 10))
+    def paint_cell(self, cell):
+        """Repaint one cell from the background plus whatever occupies it now"""
+        x, y = self.to_pixels(cell)
+        rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
+        screen.blit(background, rect, rect)
+        body = self.engine.body
+        if cell == body[0]:
+            pygame.draw.rect(screen, LIGHT_GREEN, (x, y, CELL_SIZE - 1, CELL_SIZE - 1))
+        elif not self.engine.free_cells.is_free(cell):
+            pygame.draw.rect(screen, GREEN, (x, y, CELL_SIZE - 1, CELL_SIZE - 1))
+        elif cell == self.engine.food:
+            pygame.draw.rect(screen, YELLOW, rect)
+        return rect
+
+    def cells_in(self, rect):
+        """Grid cells overlapping a pixel rect"""
+        cols = range(max(rect.left // CELL_SIZE, 0), min((rect.right - 1) // CELL_SIZE + 1, GRID_COLS))
+        rows = range(max(rect.top // CELL_SIZE, 0), min((rect.bottom - 1) // CELL_SIZE + 1, GRID_ROWS))
+        return [row * GRID_COLS + col for row in rows for col in cols]
+
+    def draw_full(self):
+        screen.blit(background, (0, 0))
+        self.draw_snake()
+        self.draw_food()
+        self.draw_ui()
+        self.full_redraw = False
+        self.dirty_cells.clear()
+
+    def draw_dirty(self):
+        """Repaint what the ticks since the last frame changed and return the
+        dirty rects"""
+        dirty = [self.paint_cell(cell) for cell in self.dirty_cells]
+        self.dirty_cells.clear()
+
+        # The score sits on top of the board: redraw it when it changes or
+        # when a repainted cell has wiped part of it
+        if self.score != self.drawn_score or self.score_rect.collidelist(dirty) != -1:
+            old_rect = self.score_rect
+            text_rect = self.draw_ui(blit=False)
+            area = old_rect.union(text_rect)
+            for cell in self.cells_in(area):
+                self.paint_cell(cell)
+            screen.blit(self.score_text, text_rect)
+            dirty.append(area)
+        return dirty
+
+    def queue_turn(self, direction):
+        """Buffer an arrow-key press for the coming ticks. A press that
+        repeats or reverses the direction it would follow is ignored."""
+        heading = self.turns[-1][0] if self.turns else DIRECTIONS[self.engine.direction]
+        if direction == heading or DIRECTION_INDEX[direction] == (DIRECTION_INDEX[heading] + 2) % 4:
+            return
+        if len(self.turns) >= INPUT_QUEUE_SIZE:
+            self.input_stats["dropped"] += 1
+            return
+        self.turns.append((direction, time.perf_counter()))
+
+    def next_turn(self):
+        """Apply the oldest queued press, if any, to the coming tick"""
+        if self.turns:
+            self.direction, pressed_at = self.turns.popleft()
+            self.timer.record("key->turn", pressed_at)
+            self.input_stats["turns"] += 1
+
+    def draw_ui(self, blit=True):
+        if self.score != self.drawn_score:
+            self.score_text = font.render(f"Score: {self.score}", True, WHITE)
+            self.drawn_score = self.score
+        self.score_rect = self.score_text.get_rect(topleft=(10, 10))
+        if blit:
+            screen.blit(self.score_text, self.score_rect)
+        return self.score_rect
 
     def show_game_over(self):
         pygame.mixer.music.stop()
-        if sound_over:
-            sound_over.play()
+        sound_over.play()
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         overlay.set_alpha(180)
         overlay.fill(BLACK)
@@ -174,6 +250,13 @@ class SnakeGame:
         screen.blit(text_restart, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 + 50))
         screen.blit(text_back, (SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 + 90))
 
+    def toggle_autopilot(self):
+        if self.autopilot is None:
+            self.autopilot = Autopilot(self.engine)
+            self.assisted = True
+        else:
+            self.autopilot = None
+
     def run(self):
         while self.running:
             for event in pygame.event.get():
@@ -183,36 +266,68 @@ class SnakeGame:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.running = False
+                        self.return_home = True
                         pygame.mixer.music.stop()
-                        self.return_to_home()
                     if event.key == pygame.K_RETURN and self.game_over:
-                        self.__init__()
-
+                        self.__init__(demo=self.autopilot is not None, timer=self.timer,
+                                      input_stats=self.input_stats)
+                    if event.key == pygame.K_a and not self.game_over:
+                        self.toggle_autopilot()
+                        self.turns.clear()
+                    if event.key in ARROW_KEYS and self.autopilot is None and not self.game_over:
+                        self.queue_turn(ARROW_KEYS[event.key])
+
+            # The simulation runs however many fixed steps are due,
+            # independent of the render rate, taking one queued turn each
             if not self.game_over:
-                self.handle_input()
-                self.move()
-                self.check_collision()
-
-                screen.fill(BLACK)
-                self.draw_grid()
-                self.draw_snake()
-                self.draw_food()
-                self.draw_ui()
-            else:
-                self.show_game_over()
-
-            pygame.display.update()
-            self.clock.tick(self.speed)
-
-    def return_to_home(self):
-        """Return to Tkinter home screen"""
-        pygame.quit()
-        python = sys.executable
-        subprocess.Popen([python, os.path.join(BASE_DIR, "main_tkinter.py")])
-        sys.exit()
+                for _ in range(self.ticker.advance()):
+                    if self.autopilot is not None:
+                        self.direction = DIRECTIONS[self.autopilot.next_action()]
+                    else:
+                        self.next_turn()
+                    self.move()
+                    if self.game_over:
+                        break
+
+            if self.game_over:
+                # The overlay is static, so draw it once
+                if not self.game_over_shown:
+                    self.show_game_over()
+                    pygame.display.update()
+                    self.game_over_shown = True
+            elif self.full_redraw:
+                self.draw_full()
+                pygame.display.update()
+            elif self.dirty_cells:
+                pygame.display.update(self.draw_dirty())
+
+            self.clock.tick(RENDER_FPS)
+
+
+def play(demo=False):
+    """Run manual mode in this process. Returns True if the player pressed
+    ESC to go back to the home screen. ``demo`` starts with the autopilot
+    playing."""
+    open_window()
+    game = SnakeGame(demo)
+    game.run()
+    pygame.mixer.music.stop()
+    pygame.display.quit()  # keep the mixer and fonts initialised for next time
+    latency = game.timer.summary().get("key->turn")
+    if latency:
+        stats = game.input_stats
+        print(f"⌨ {stats['turns']} turns, {stats['dropped']} presses dropped; key to turn "
+              f"(last {latency['count']}): p50 {latency['p50']:.0f} / "
+              f"p95 {latency['p95']:.0f} / p99 {latency['p99']:.0f} ms")
+    return game.return_home
 
 
 # Run the game
 if __name__ == "__main__":
-    game = SnakeGame()
-    game.run()
+    parser = argparse.ArgumentParser(description="Snake - manual mode")
+    parser.add_argument("--demo", action="store_true",
+                        help="let the autopilot play (press A to take over)")
+    args = parser.parse_args()
+    if play(demo=args.demo):
+        import main_tkinter
+        main_tkinter.main()
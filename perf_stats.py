@@ -0,0 +1,88 @@
+"""Per-stage latency timing for the gesture pipeline.
+
+Stages are timed with plain ``perf_counter`` calls::
+
+    start = time.perf_counter()
+    ret, frame = cap.read()
+    timer.record("cap.read", start)
+
+Each stage keeps a rolling window of samples for p50/p95/p99, and with
+``keep_trace`` every sample is also kept for ``export`` to CSV or JSON.
+"""
+import csv
+import json
+import threading
+import time
+from collections import deque
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * pct / 100), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class StageTimer:
+    def __init__(self, window=300, keep_trace=False):
+        self.window = window
+        self.samples = {}
+        self.keep_trace = keep_trace
+        self.trace = []  # (time since start in s, stage, ms)
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()  # stages may be recorded from other threads
+
+    def record(self, stage, start, end=None):
+        """Record the time from ``start`` (a perf_counter value) to now or ``end``"""
+        if end is None:
+            end = time.perf_counter()
+        self.add(stage, (end - start) * 1000, end)
+
+    def add(self, stage, ms, at=None):
+        with self._lock:
+            samples = self.samples.get(stage)
+            if samples is None:
+                samples = self.samples[stage] = deque(maxlen=self.window)
+            samples.append(ms)
+            if self.keep_trace:
+                at = time.perf_counter() if at is None else at
+                self.trace.append((at - self.started, stage, ms))
+
+    def summary(self):
+        """{stage: {"count", "p50", "p95", "p99", "max"}} over the rolling window"""
+        with self._lock:
+            windows = {stage: sorted(samples) for stage, samples in self.samples.items()}
+        summary = {}
+        for stage, values in windows.items():
+            row = {"count": len(values), "max": values[-1] if values else 0.0}
+            for pct in PERCENTILES:
+                row[f"p{pct}"] = percentile(values, pct)
+            summary[stage] = row
+        return summary
+
+    def overlay_lines(self):
+        lines = [f"{'stage':<15}{'p50':>8}{'p95':>8}{'p99':>8} ms"]
+        for stage, row in self.summary().items():
+            lines.append(f"{stage:<15}{row['p50']:>8.2f}{row['p95']:>8.2f}{row['p99']:>8.2f}")
+        return lines
+
+    def export(self, path):
+        """Write the trace (or the summary if no trace was kept) to .json or .csv"""
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({
+                    "summary": self.summary(),
+                    "trace": [{"t": t, "stage": s, "ms": ms} for t, s, ms in self.trace],
+                }, f, indent=1)
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            if self.trace:
+                writer.writerow(["t", "stage", "ms"])
+                writer.writerows(self.trace)
+            else:
+                writer.writerow(["stage", "count", "p50", "p95", "p99", "max"])
+                for stage, row in self.summary().items():
+                    writer.writerow([stage, row["count"], row["p50"], row["p95"], row["p99"], row["max"]])
@@ -0,0 +1,158 @@
+"""Compact deterministic replays and fast headless verification.
+
+A replay is the engine setup, the food RNG seed and the direction taken on
+each tick. Directions are 2-bit values run-length encoded as varints of
+``run << 2 | direction``, so a typical game is a few dozen bytes::
+
+    python replay.py verify replays/            # re-simulate and check scores
+    python replay.py verify replays/ -j 8       # across 8 processes
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from snake_engine import SnakeEngine
+
+MAGIC = b"SNKR"
+VERSION = 1
+# magic, version, cols, rows, start x, start y, start length, seed, ticks, score
+HEADER = struct.Struct("<4sBHHHHHQII")
+EXTENSION = ".snkr"
+
+Replay = namedtuple("Replay", "cols rows start length seed ticks score moves")
+
+
+# -------------------------------
+# Encoding
+# -------------------------------
+def encode_moves(moves):
+    out = bytearray()
+    i, n = 0, len(moves)
+    while i < n:
+        direction = moves[i]
+        j = i + 1
+        while j < n and moves[j] == direction:
+            j += 1
+        value = (j - i) << 2 | direction
+        while value >= 0x80:
+            out.append(value & 0x7F | 0x80)
+            value >>= 7
+        out.append(value)
+        i = j
+    return bytes(out)
+
+
+def decode_moves(data):
+    moves = bytearray()
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        moves.extend(bytes((value & 3,)) * (value >> 2))
+        value = shift = 0
+    return bytes(moves)
+
+
+def encode(engine):
+    """Serialize a recorded game (``SnakeEngine(record=True)``)"""
+    x, y = engine.start
+    header = HEADER.pack(MAGIC, VERSION, engine.cols, engine.rows, x, y, engine.length,
+                         engine.seed, engine.ticks, engine.score)
+    return header + encode_moves(engine.moves)
+
+
+def decode(data):
+    magic, version, cols, rows, x, y, length, seed, ticks, score = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a snake replay")
+    return Replay(cols, rows, (x, y), length, seed, ticks, score,
+                  decode_moves(memoryview(data)[HEADER.size:]))
+
+
+def save(engine, directory, prefix="game"):
+    """Write a finished game to ``directory`` and return the file path"""
+    os.makedirs(directory, exist_ok=True)
+    name = f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}-{engine.seed:016x}{EXTENSION}"
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(encode(engine))
+    return path
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+
+# -------------------------------
+# Verification
+# -------------------------------
+def simulate(replay):
+    """Re-run a replay headlessly and return the resulting engine"""
+    engine = SnakeEngine(replay.cols, replay.rows, start=replay.start,
+                         length=replay.length, seed=replay.seed)
+    step = engine.step
+    for direction in replay.moves:
+        step(direction)
+    return engine
+
+
+def verify(path):
+    """(path, ok, claimed score, simulated score) for one replay file"""
+    try:
+        replay = load(path)
+    except (OSError, ValueError, struct.error):
+        return path, False, None, None
+    engine = simulate(replay)
+    ok = engine.score == replay.score and engine.ticks == replay.ticks
+    return path, ok, replay.score, engine.score
+
+
+def verify_many(paths, processes=None):
+    """Verify replays across a process pool; returns verify() tuples in order"""
+    if processes == 1 or len(paths) < 64:
+        return [verify(p) for p in paths]
+    with ProcessPoolExecutor(processes) as pool:
+        chunk = max(len(paths) // ((processes or os.cpu_count() or 1) * 4), 1)
+        return list(pool.map(verify, paths, chunksize=chunk))
+
+
+def collect(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.endswith(EXTENSION))
+        else:
+            files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake replay tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    check = sub.add_parser("verify", help="re-simulate replays and check their scores")
+    check.add_argument("paths", nargs="+", help="replay files or directories")
+    check.add_argument("-j", "--jobs", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    files = collect(args.paths)
+    start = time.perf_counter()
+    results = verify_many(files, args.jobs)
+    elapsed = time.perf_counter() - start
+    bad = [r for r in results if not r[1]]
+    for path, _, claimed, actual in bad:
+        print(f"❌ {path}: claimed {claimed}, replay gives {actual}")
+    print(f"✅ {len(results) - len(bad)}/{len(results)} replays verified "
+          f"in {elapsed:.2f} s ({len(results) / elapsed if elapsed else 0:.0f}/s)")
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
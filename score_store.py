@@ -0,0 +1,115 @@
+"""High scores in an append-only SQLite database.
+
+Each finished game adds one row. The file runs in WAL mode, so a crash
+mid-game never corrupts earlier scores and the menu can read while a game
+writes. Pages are fetched by keyset (the last row's score and id) rather
+than OFFSET, so any page of the top list is an index range scan even with
+millions of rows::
+
+    store = ScoreStore()
+    store.add("manual", score=120, length=15, duration=42.0)
+    page = store.top(10, mode="manual")
+    next_page = store.top(10, mode="manual", after=page[-1])
+"""
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "scores.db")
+
+Score = namedtuple("Score", "id mode score length duration played_at")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    mode TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    played_at REAL NOT NULL
+);
+-- Ties rank by rowid, which every index carries implicitly
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score);
+CREATE INDEX IF NOT EXISTS scores_by_mode ON scores (mode, score);
+"""
+COLUMNS = "id, mode, score, length, duration, played_at"
+
+
+class ScoreStore:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")  # durable across crashes in WAL mode
+        self.db.executescript(SCHEMA)
+
+    def add(self, mode, score, length, duration, played_at=None):
+        """Append one finished game and return its id"""
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO scores (mode, score, length, duration, played_at) VALUES (?, ?, ?, ?, ?)",
+                (mode, score, length, duration, time.time() if played_at is None else played_at))
+        return cursor.lastrowid
+
+    def add_many(self, rows):
+        """Append ``(mode, score, length, duration, played_at)`` rows in one transaction"""
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO scores (mode, score, length, duration, played_at) VALUES (?, ?, ?, ?, ?)",
+                rows)
+
+    def top(self, n=10, mode=None, after=None):
+        """Best ``n`` scores, highest first (newest first among ties),
+        optionally for one mode. ``after`` is the last Score of the previous
+        page."""
+        where, params = [], []
+        if mode is not None:
+            where.append("mode = ?")
+            params.append(mode)
+        if after is not None:
+            where.append("(score, id) < (?, ?)")
+            params.extend((after.score, after.id))
+        sql = f"SELECT {COLUMNS} FROM scores"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY score DESC, id DESC LIMIT ?"
+        params.append(n)
+        return [Score(*row) for row in self.db.execute(sql, params)]
+
+    def best(self, mode=None):
+        rows = self.top(1, mode)
+        return rows[0] if rows else None
+
+    def modes(self):
+        """Modes that have at least one score"""
+        # Skip-scan over the (mode, score) index: one seek per distinct mode
+        modes, last = [], ""
+        while True:
+            row = self.db.execute("SELECT mode FROM scores WHERE mode > ? ORDER BY mode LIMIT 1",
+                                  (last,)).fetchone()
+            if row is None:
+                return modes
+            last = row[0]
+            modes.append(last)
+
+    def close(self):
+        self.db.close()
+
+
+# -------------------------------
+# Game-over hook shared by both modes
+# -------------------------------
+_store = None
+
+def record_game(mode, engine, duration):
+    """Save a finished SnakeEngine game; a failing database never stops the game"""
+    global _store
+    try:
+        if _store is None:
+            _store = ScoreStore()
+        return _store.add(mode, engine.score, len(engine.body), duration)
+    except sqlite3.Error as e:
+        print("Score Error:", e)
+        return None
@@ -0,0 +1,129 @@
+"""Vectorized NumPy engine that steps many snake games at once.
+
+Same rules as ``snake_engine.SnakeEngine`` (walls, self collision, +10 per
+food, reversals ignored) but every game lives in a row of shared arrays, so
+one ``step(actions)`` advances all of them without a per-game Python loop::
+
+    batch = SnakeBatch(4096, 40, 30, seed=0)
+    heads, rewards, dones = batch.step(actions)   # actions: (n,) ints 0..3
+
+Directions use the ``snake_engine.DIRECTIONS`` order (UP, RIGHT, DOWN, LEFT).
+"""
+import numpy as np
+
+from snake_engine import OFFSETS, POINTS_PER_FOOD
+
+DX = np.array([dx for dx, _ in OFFSETS], dtype=np.int32)
+DY = np.array([dy for _, dy in OFFSETS], dtype=np.int32)
+
+
+class SnakeBatch:
+    def __init__(self, n, cols, rows, start=(5, 2), length=3, seed=None, autoreset=True):
+        self.n = n
+        self.cols = cols
+        self.rows = rows
+        self.cells = cols * rows
+        self.start = start
+        self.start_length = length
+        self.autoreset = autoreset
+        self.rng = np.random.default_rng(seed)
+
+        # Occupancy per game, kept flat so a (game, cell) pair is one offset
+        self.board = np.zeros((n, self.cells), dtype=bool)
+        self._board_flat = self.board.reshape(-1)
+        self._base = np.arange(n, dtype=np.int64) * self.cells
+        # Body ring buffer: body[g, head_ptr[g]] is the head, the tail sits
+        # length - 1 slots behind it
+        self.body = np.zeros((n, self.cells), dtype=np.int32)
+        self._body_flat = self.body.reshape(-1)
+        self.head_ptr = np.zeros(n, dtype=np.int64)
+        self.length = np.zeros(n, dtype=np.int64)
+        self.head_x = np.zeros(n, dtype=np.int32)
+        self.head_y = np.zeros(n, dtype=np.int32)
+        self.direction = np.zeros(n, dtype=np.int8)
+        self.food = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self.reset()
+
+    def reset(self, mask=None):
+        """Restart the games selected by a boolean mask (all games by default)"""
+        games = np.arange(self.n) if mask is None else np.flatnonzero(mask)
+        if not len(games):
+            return
+        x, y = self.start
+        k = self.start_length
+        self.board[games] = False
+        segments = y * self.cols + x - np.arange(k - 1, -1, -1)  # tail ... head
+        self.body[games, :k] = segments
+        self.board[games[:, None], segments] = True
+        self.head_ptr[games] = k - 1
+        self.length[games] = k
+        self.head_x[games] = x
+        self.head_y[games] = y
+        self.direction[games] = 1  # RIGHT
+        self.score[games] = 0
+        self.done[games] = False
+        self._spawn_food(games)
+
+    def _spawn_food(self, games):
+        """Place food uniformly on an empty cell of each game; -1 if full"""
+        free = ~self.board[games]
+        counts = free.sum(axis=1)
+        pick = (self.rng.random(len(games)) * counts).astype(np.int64)
+        food = np.argmax(np.cumsum(free, axis=1) > pick[:, None], axis=1)
+        food[counts == 0] = -1
+        self.food[games] = food
+
+    def step(self, actions=None):
+        """Advance every live game one tick.
+
+        ``actions`` is an (n,) array of direction indexes; -1 or None keeps
+        going straight. Returns ``(heads, rewards, dones)`` where ``dones``
+        flags games that ended on this tick. With ``autoreset`` those games
+        are restarted before returning.
+        """
+        alive = ~self.done
+        if actions is not None:
+            actions = np.asarray(actions)
+            turn = (actions >= 0) & (actions != (self.direction + 2) % 4)
+            self.direction = np.where(turn, actions, self.direction).astype(np.int8)
+
+        nx = self.head_x + DX[self.direction]
+        ny = self.head_y + DY[self.direction]
+        wall = (nx < 0) | (nx >= self.cols) | (ny < 0) | (ny >= self.rows)
+        moving = alive & ~wall
+        head = np.where(moving, ny * self.cols + nx, 0)
+        ate = moving & (head == self.food)
+
+        # Free the tails first: a head may legally move into its own tail
+        shrink = np.flatnonzero(moving & ~ate)
+        tail_slot = (self.head_ptr[shrink] - self.length[shrink] + 1) % self.cells
+        tail = self._body_flat[self._base[shrink] + tail_slot]
+        self._board_flat[self._base[shrink] + tail] = False
+
+        hit = moving & self._board_flat[self._base + head]
+        # A collision leaves the body as it was: take the tail back
+        self._board_flat[self._base[shrink] + tail] |= hit[shrink]
+        ok = np.flatnonzero(moving & ~hit)
+        ptr = (self.head_ptr[ok] + 1) % self.cells
+        self.head_ptr[ok] = ptr
+        self._body_flat[self._base[ok] + ptr] = head[ok]
+        self._board_flat[self._base[ok] + head[ok]] = True
+        self.head_x[ok] = nx[ok]
+        self.head_y[ok] = ny[ok]
+
+        ate &= ~hit
+        rewards = ate * POINTS_PER_FOOD
+        self.score += rewards
+        self.length += ate
+        eaten = np.flatnonzero(ate)
+        if len(eaten):
+            self._spawn_food(eaten)
+
+        dones = alive & (wall | hit | (self.food < 0))
+        self.done |= dones
+        heads = np.where(dones, -1, head)
+        if self.autoreset and dones.any():
+            self.reset(dones)
+        return heads, rewards, dones
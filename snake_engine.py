@@ -0,0 +1,127 @@
+"""Headless snake rules shared by the manual and gesture front ends.
+
+Pure Python with no pygame, display or audio, so it imports instantly and
+can be stepped millions of times for testing and bots::
+
+    engine = SnakeEngine(40, 30)
+    state = engine.reset(seed=1)
+    state, reward, done = engine.step("UP")
+"""
+import random
+from collections import deque, namedtuple
+
+from bit_grid import BitGrid
+from free_cells import FreeCells
+
+DIRECTIONS = ("UP", "RIGHT", "DOWN", "LEFT")
+DIRECTION_INDEX = {name: i for i, name in enumerate(DIRECTIONS)}
+OFFSETS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+POINTS_PER_FOOD = 10
+# Boards bigger than this track occupancy in a BitGrid (1 bit per cell)
+# instead of FreeCells (two Python int lists)
+BIT_GRID_CELLS = 1 << 18
+
+# What changed in one tick. Cells are ``row * cols + col`` ints; ``tail`` is
+# the vacated cell (None when the snake grew) and ``food`` None on a full board.
+StepState = namedtuple("StepState", "head tail food score")
+
+
+def default_occupancy(cols, rows):
+    """The occupancy class for a board; depends only on its size, so
+    replays re-simulate with the same food sequence"""
+    return BitGrid if cols * rows > BIT_GRID_CELLS else FreeCells
+
+
+class SnakeEngine:
+    """``record`` keeps the direction taken on every tick in ``moves`` so the
+    game can be saved as a replay (see replay.py).
+
+    ``occupancy`` is the class tracking empty cells (FreeCells or BitGrid);
+    by default it is chosen from the board size."""
+
+    def __init__(self, cols, rows, start=(5, 2), length=3, seed=None, record=False,
+                 occupancy=None):
+        self.cols = cols
+        self.rows = rows
+        self.start = start
+        self.length = length
+        self.record = record
+        self.occupancy = occupancy or default_occupancy(cols, rows)
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Start a new game heading right from ``start`` and return its state.
+        Without a seed one is drawn, so every game can be replayed."""
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.moves = bytearray()
+        self.free_cells = self.occupancy(self.cols, self.rows)
+        x, y = self.start
+        self.body = deque(y * self.cols + x - i for i in range(self.length))
+        for cell in self.body:
+            self.free_cells.occupy(cell)
+        self.head_x, self.head_y = x, y
+        self.direction = DIRECTION_INDEX["RIGHT"]
+        self.score = 0
+        self.ticks = 0
+        self.done = False
+        self.food = self.free_cells.sample(self.rng)
+        self.state = StepState(self.body[0], None, self.food, 0)
+        return self.state
+
+    def xy(self, cell):
+        """(col, row) of a cell index"""
+        row, col = divmod(cell, self.cols)
+        return col, row
+
+    def step(self, action=None):
+        """Advance one tick and return ``(state, reward, done)``.
+
+        ``action`` is a direction name or index, or None to keep going
+        straight. Turning back onto the neck is ignored.
+        """
+        if self.done:
+            return self.state, 0, True
+        if action is not None:
+            action = DIRECTION_INDEX.get(action, action)
+            if action != (self.direction + 2) % 4:
+                self.direction = action
+        if self.record:
+            self.moves.append(self.direction)
+
+        self.ticks += 1
+        dx, dy = OFFSETS[self.direction]
+        x = self.head_x + dx
+        y = self.head_y + dy
+        if not (0 <= x < self.cols and 0 <= y < self.rows):
+            self.done = True
+            return self.state, 0, True
+
+        head = y * self.cols + x
+        free_cells = self.free_cells
+        ate = head == self.food
+        # The head may legally move into the tail, which leaves this tick;
+        # any other occupied cell ends the game with the body left as it was
+        if not free_cells.is_free(head) and head != self.body[-1]:
+            self.done = True
+            self.state = StepState(head, None, self.food, self.score)
+            return self.state, 0, True
+        tail = None
+        if not ate:
+            tail = self.body.pop()
+            free_cells.release(tail)
+
+        self.body.appendleft(head)
+        free_cells.occupy(head)
+        self.head_x, self.head_y = x, y
+        reward = 0
+        if ate:
+            reward = POINTS_PER_FOOD
+            self.score += reward
+            self.food = free_cells.sample(self.rng)
+            if self.food is None:
+                self.done = True
+        self.state = StepState(head, tail, self.food, self.score)
+        return self.state, reward, self.done
@@ -0,0 +1,38 @@
+"""Shared font registry and rendered-text cache for pygame HUDs.
+
+``pygame.font.SysFont`` scans the system fonts on every call and
+``Font.render`` rasterises the string again, so HUD code should go through
+``render_text``: unchanged text is then just a dictionary lookup and a blit.
+"""
+import pygame
+
+FONT_NAME = "Poppins"
+MAX_CACHED_TEXTS = 256
+
+_fonts = {}
+_texts = {}
+
+
+def get_font(size, bold=False, name=FONT_NAME):
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.SysFont(name, size, bold=bold)
+    return font
+
+
+def render_text(text, size, color, bold=False, name=FONT_NAME):
+    """Antialiased text surface, rendered once per (text, size, color, font)"""
+    key = (text, size, color, bold, name)
+    surface = _texts.get(key)
+    if surface is None:
+        if len(_texts) >= MAX_CACHED_TEXTS:
+            del _texts[next(iter(_texts))]  # evict the oldest entry
+        surface = _texts[key] = get_font(size, bold, name).render(text, True, color)
+    return surface
+
+
+def clear():
+    """Drop cached fonts and surfaces (needed after pygame.font.quit)"""
+    _fonts.clear()
+    _texts.clear()